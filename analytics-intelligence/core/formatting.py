@@ -0,0 +1,9 @@
+import pandas as pd
+
+def is_missing(value):
+    """True for a KPI that was never measured: None from the database or NaN from a DataFrame."""
+    return value is None or pd.isna(value)
+
+def fmt(value, spec, suffix=""):
+    """`value` formatted with `spec` plus `suffix`, or "–" when it is missing."""
+    return "–" if is_missing(value) else f"{value:{spec}}{suffix}"
@@ -1,42 +1,95 @@
 import pandas as pd
+from sqlalchemy import func, select
 from db.database import SessionLocal
-from db.models import Video, DailyMetric, RetentionData
+from db.models import Video, DailyMetric, RetentionData, VideoType
+
+# Columns returned for each video, in the shape get_channel_overview() has always used
+OVERVIEW_COLUMNS = [
+    Video.id,
+    Video.title,
+    Video.status,
+    Video.video_type.label("type"),
+    Video.total_views,
+    Video.hook_score,
+    Video.packaging_score,
+    Video.engagement_efficiency,
+    Video.avg_ctr,
+    Video.recommendation,
+]
+
+# Columns get_top_videos() can rank by
+RANKABLE = {
+    "total_views": Video.total_views,
+    "hook_score": Video.hook_score,
+    "packaging_score": Video.packaging_score,
+    "engagement_efficiency": Video.engagement_efficiency,
+    "avg_ctr": Video.avg_ctr,
+}
 
 class IntelligenceEngine:
     def __init__(self, db):
         self.db = db
 
-    def get_channel_overview(self):
-        videos = self.db.query(Video).all()
-        overview = []
-        for v in videos:
-            overview.append({
-                "id": v.id,
-                "title": v.title,
-                "status": v.status,
-                "type": v.video_type.value,
-                "total_views": v.total_views,
-                "hook_score": v.hook_score,
-                "packaging_score": v.packaging_score,
-                "engagement_efficiency": v.engagement_efficiency,
-                "avg_ctr": v.avg_ctr,
-                "recommendation": v.recommendation,
-            })
-        return overview
+    def _filter(self, stmt, types=None, statuses=None):
+        """Restrict `stmt` to the given video types ("short"/"long") and statuses; None means all."""
+        if types is not None:
+            stmt = stmt.where(Video.video_type.in_([VideoType(t) for t in types]))
+        if statuses is not None:
+            stmt = stmt.where(Video.status.in_(list(statuses)))
+        return stmt
+
+    def _rows(self, stmt):
+        rows = []
+        for row in self.db.execute(stmt).mappings():
+            row = dict(row)
+            row["type"] = row["type"].value
+            rows.append(row)
+        return rows
+
+    def get_channel_overview(self, types=None, statuses=None):
+        """One dict per video, read in a single query without loading Video objects."""
+        return self._rows(self._filter(select(*OVERVIEW_COLUMNS), types, statuses))
+
+    def get_statuses(self):
+        return list(self.db.scalars(select(Video.status).distinct().order_by(Video.status)))
+
+    def get_totals(self, types=None, statuses=None):
+        """Video count, total views and mean KPIs; means are None when nothing matches."""
+        stmt = select(
+            func.count(Video.id).label("videos"),
+            func.coalesce(func.sum(Video.total_views), 0).label("total_views"),
+            func.avg(Video.total_views).label("avg_views"),
+            func.avg(Video.hook_score).label("avg_hook_score"),
+            func.avg(Video.packaging_score).label("avg_packaging_score"),
+            func.avg(Video.engagement_efficiency).label("avg_engagement_efficiency"),
+            func.avg(Video.avg_ctr).label("avg_ctr"),
+        )
+        return dict(self.db.execute(self._filter(stmt, types, statuses)).mappings().one())
+
+    def get_type_breakdown(self, types=None, statuses=None):
+        """Totals and means per video type."""
+        stmt = select(
+            Video.video_type.label("type"),
+            func.count(Video.id).label("videos"),
+            func.sum(Video.total_views).label("total_views"),
+            func.avg(Video.total_views).label("avg_views"),
+            func.avg(Video.hook_score).label("avg_hook_score"),
+            func.avg(Video.packaging_score).label("avg_packaging_score"),
+        ).group_by(Video.video_type).order_by(Video.video_type)
+        return self._rows(self._filter(stmt, types, statuses))
+
+    def get_video_titles(self, types=None, statuses=None):
+        """(id, title) of every matching video, most viewed first; cheap enough to list them all."""
+        stmt = self._filter(select(Video.id, Video.title), types, statuses)
+        return [tuple(row) for row in self.db.execute(stmt.order_by(Video.total_views.desc(), Video.id))]
+
+    def get_top_videos(self, metric="total_views", n=10, types=None, statuses=None):
+        """The n videos with the highest `metric` (a key of RANKABLE), as overview rows."""
+        if metric not in RANKABLE:
+            raise ValueError(f"Can't rank videos by {metric!r}; choose one of {', '.join(RANKABLE)}")
+        stmt = self._filter(select(*OVERVIEW_COLUMNS), types, statuses)
+        return self._rows(stmt.order_by(RANKABLE[metric].desc(), Video.id).limit(n))
 
     def get_video_kpis(self, video_id: str):
-        v = self.db.query(Video).filter(Video.id == video_id).first()
-        if not v:
-            return None
-        return {
-            "id": v.id,
-            "title": v.title,
-            "status": v.status,
-            "type": v.video_type.value,
-            "total_views": v.total_views,
-            "hook_score": v.hook_score,
-            "packaging_score": v.packaging_score,
-            "engagement_efficiency": v.engagement_efficiency,
-            "avg_ctr": v.avg_ctr,
-            "recommendation": v.recommendation,
-        }
+        rows = self._rows(select(*OVERVIEW_COLUMNS).where(Video.id == video_id))
+        return rows[0] if rows else None
@@ -4,8 +4,10 @@ import plotly.express as px
 import plotly.graph_objects as go
 from sqlalchemy.orm import Session
 from db.database import SessionLocal
-from db.models import Video, DailyMetric, RetentionData, VideoType
-from core.intelligence import IntelligenceEngine
+from db.migrations import upgrade
+from db.models import DailyMetric, RetentionData, VideoType
+from core.formatting import fmt
+from core.intelligence import IntelligenceEngine, OVERVIEW_COLUMNS
 
 st.set_page_config(page_title="VibeIntelligence Dashboard", layout="wide", initial_sidebar_state="expanded")
 
@@ -18,37 +20,60 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
-def load_data():
+@st.cache_resource
+def migrate_db():
+    upgrade()
+
+migrate_db()
+
+# Most videos sent to the per-video charts; totals and the deep-dive picker always cover every video
+MAX_CHART_VIDEOS = 500
+
+def load_statuses():
     db = SessionLocal()
-    engine = IntelligenceEngine(db)
-    videos = db.query(Video).all()
-    overview = engine.get_channel_overview()
-    db.close()
-    return videos, overview
+    try:
+        return IntelligenceEngine(db).get_statuses()
+    finally:
+        db.close()
 
-videos, overview = load_data()
-df_overview = pd.DataFrame(overview)
+def load_data(types, statuses):
+    """Aggregates, top-N rows and the id → title list for the current filters, all computed in SQLite."""
+    db = SessionLocal()
+    try:
+        engine = IntelligenceEngine(db)
+        return {
+            "totals": engine.get_totals(types, statuses),
+            "by_type": engine.get_type_breakdown(types, statuses),
+            "top_views": engine.get_top_videos("total_views", MAX_CHART_VIDEOS, types, statuses),
+            "top_hooks": engine.get_top_videos("hook_score", 20, types, statuses),
+            "titles": dict(engine.get_video_titles(types, statuses)),
+        }
+    finally:
+        db.close()
 
 st.title("🚀 VibeIntelligence: @thevibecoder69")
 st.subheader("Creator Intelligence System")
 
 # Sidebar Filters
 st.sidebar.title("Filters")
+statuses = load_statuses()
 video_type = st.sidebar.multiselect("Content Type", options=["short", "long"], default=["short", "long"])
-status_filter = st.sidebar.multiselect("Status", options=df_overview['status'].unique(), default=df_overview['status'].unique())
+status_filter = st.sidebar.multiselect("Status", options=statuses, default=statuses)
 
-filtered_df = df_overview[(df_overview['type'].isin(video_type)) & (df_overview['status'].isin(status_filter))]
+data = load_data(video_type, status_filter)
+totals = data["totals"]
+filtered_df = pd.DataFrame(data["top_views"], columns=[c.key for c in OVERVIEW_COLUMNS])
 
 # Top Metrics Row
 col1, col2, col3, col4 = st.columns(4)
 with col1:
-    st.metric("Total Videos", len(filtered_df))
+    st.metric("Total Videos", totals["videos"])
 with col2:
-    st.metric("Total Views", f"{filtered_df['total_views'].sum():,}")
+    st.metric("Total Views", f"{totals['total_views']:,}")
 with col3:
-    st.metric("Avg Hook Score", f"{pd.to_numeric(filtered_df['hook_score'].str.strip('%')).mean():.1f}%")
+    st.metric("Avg Hook Score", fmt(totals["avg_hook_score"], ".1f", "%"))
 with col4:
-    st.metric("Avg Packaging", f"{pd.to_numeric(filtered_df['packaging_score']).mean():.1f}")
+    st.metric("Avg Packaging", fmt(totals["avg_packaging_score"], ".1f"))
 
 st.divider()
 
@@ -66,20 +91,18 @@ with tab1:
     
     with c2:
         st.subheader("Hook Quality vs Engagement")
-        # Convert types for plotting
-        plot_df = filtered_df.copy()
-        plot_df['hook_num'] = pd.to_numeric(plot_df['hook_score'].str.strip('%'))
-        plot_df['engagement_num'] = pd.to_numeric(plot_df['engagement_efficiency'])
-        
-        fig = px.bar(plot_df, x="title", y="hook_num", color="engagement_num", 
-                     template="plotly_dark", title="Retention Hook Quality by Video")
+        hooks_df = pd.DataFrame(data["top_hooks"], columns=filtered_df.columns)
+        fig = px.bar(hooks_df, x="title", y="hook_score", color="engagement_efficiency", 
+                     template="plotly_dark", title="Retention Hook Quality by Video",
+                     labels={"hook_score": "Hook Score (%)", "engagement_efficiency": "Likes / 1k Views"})
         st.plotly_chart(fig, use_container_width=True)
 
 with tab2:
-    selected_video_title = st.selectbox("Select Video for Deep Dive", options=filtered_df['title'].tolist())
-    video_id = filtered_df[filtered_df['title'] == selected_video_title]['id'].values[0]
+    titles = data["titles"]
+    video_id = st.selectbox("Select Video for Deep Dive", options=list(titles), format_func=titles.get)
     
     db = SessionLocal()
+    v_analysis = IntelligenceEngine(db).get_video_kpis(video_id)
     retention = db.query(RetentionData).filter(RetentionData.video_id == video_id).order_by(RetentionData.timestamp_seconds).all()
     daily = db.query(DailyMetric).filter(DailyMetric.video_id == video_id).order_by(DailyMetric.date).all()
     db.close()
@@ -93,14 +116,13 @@ with tab2:
         st.plotly_chart(fig, use_container_width=True)
     
     with c2:
-        v_analysis = filtered_df[filtered_df['id'] == video_id].iloc[0]
         st.info(f"**AI Recommendation:**\n\n{v_analysis['recommendation']}")
         st.write(f"**Status:** {v_analysis['status']}")
-        st.write(f"**CTR:** {v_analysis['avg_ctr']}")
-        st.write(f"**Eng. Efficiency:** {v_analysis['engagement_efficiency']}")
+        st.write(f"**CTR:** {fmt(v_analysis['avg_ctr'], '.1f', '%')}")
+        st.write(f"**Eng. Efficiency:** {fmt(v_analysis['engagement_efficiency'], '.1f')}")
 
 with tab3:
     st.subheader("Topic Cluster Analysis")
-    cluster_performance = filtered_df.groupby('type')['total_views'].mean().reset_index()
+    cluster_performance = pd.DataFrame(data["by_type"], columns=["type", "avg_views"])
     st.bar_chart(cluster_performance.set_index('type'))
     st.write("AI Suggestion: Your Shorts on 'AI/Coding' are outperforming 'Vlog' by 40%. Triple down on MCP server tutorials.")
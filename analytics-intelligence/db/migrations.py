@@ -0,0 +1,69 @@
+from sqlalchemy import MetaData, String, inspect
+
+from db.database import Base, engine
+from db.models import Video
+
+# KPI columns that older databases store as text such as "78%" or "12.4"
+KPI_COLUMNS = ["hook_score", "packaging_score", "engagement_efficiency", "avg_ctr"]
+
+
+def _kpis_stored_as_text(conn):
+    inspector = inspect(conn)
+    if not inspector.has_table("videos"):
+        return False
+    types = {c["name"]: c["type"] for c in inspector.get_columns("videos")}
+    return any(isinstance(types.get(name), String) for name in KPI_COLUMNS)
+
+
+def _parse_kpi(value):
+    """78.0 for "78%" or "78"; None (missing, not zero) for NULL, empty or unparseable text."""
+    if value is None:
+        return None
+    try:
+        return float(str(value).strip().rstrip("%"))
+    except ValueError:
+        return None
+
+
+def _convert_kpi_columns(conn):
+    """Rebuild the videos table with numeric KPI columns, parsing the old text values.
+
+    SQLite can't change a column's type in place, so this follows its
+    documented table rebuild: create the new table under a temporary name,
+    copy the rows across, drop the old table and rename the new one.
+    """
+    new_table = Video.__table__.to_metadata(MetaData(), name="_videos_new")
+    for index in list(new_table.indexes):
+        new_table.indexes.discard(index)
+    new_table.create(conn)
+
+    columns = [c.name for c in Video.__table__.columns]
+    kpi_positions = [columns.index(name) for name in KPI_COLUMNS]
+    rows = []
+    for row in conn.exec_driver_sql(f"SELECT {', '.join(columns)} FROM videos"):
+        row = list(row)
+        for i in kpi_positions:
+            row[i] = _parse_kpi(row[i])
+        rows.append(tuple(row))
+    if rows:
+        conn.exec_driver_sql(
+            f"INSERT INTO _videos_new ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            rows,
+        )
+    conn.exec_driver_sql("DROP TABLE videos")
+    conn.exec_driver_sql("ALTER TABLE _videos_new RENAME TO videos")
+
+
+def upgrade(bind=engine):
+    """Bring the database schema up to date; safe to run on every start."""
+    with bind.begin() as conn:
+        if _kpis_stored_as_text(conn):
+            _convert_kpi_columns(conn)
+        Base.metadata.create_all(conn)
+        for index in Video.__table__.indexes:
+            index.create(conn, checkfirst=True)
+
+
+if __name__ == "__main__":
+    upgrade()
+    print("Database schema is up to date.")
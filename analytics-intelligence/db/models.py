@@ -12,13 +12,15 @@ class Video(Base):
 
     id = Column(String, primary_key=True)
     title = Column(String, nullable=False)
-    status = Column(String, default="published")
-    video_type = Column(Enum(VideoType), default=VideoType.short)
-    total_views = Column(Integer, default=0)
-    hook_score = Column(String, default="0%")
-    packaging_score = Column(String, default="0")
-    engagement_efficiency = Column(String, default="0")
-    avg_ctr = Column(String, default="0%")
+    status = Column(String, default="published", index=True)
+    video_type = Column(Enum(VideoType), default=VideoType.short, index=True)
+    total_views = Column(Integer, default=0, index=True)
+    # KPIs are stored as plain numbers and formatted for display by each consumer;
+    # NULL means not measured yet, so averages skip them instead of counting 0
+    hook_score = Column(Float, index=True)  # % of viewers still watching at 3s
+    packaging_score = Column(Float, index=True)  # actual / target CTR * 100
+    engagement_efficiency = Column(Float, index=True)  # likes per 1000 views
+    avg_ctr = Column(Float, index=True)  # %
     recommendation = Column(Text, default="No recommendation yet.")
 
     daily_metrics = relationship("DailyMetric", back_populates="video")
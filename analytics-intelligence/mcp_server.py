@@ -1,10 +1,24 @@
 from fastmcp import FastMCP
 from db.database import SessionLocal
+from db.migrations import upgrade
+from core.formatting import fmt, is_missing
 from core.intelligence import IntelligenceEngine
 import pandas as pd
 
 mcp = FastMCP("VibeIntelligence")
 
+def fmt_kpis(kpis):
+    """Display strings for the numeric KPI fields of a get_video_kpis() result; missing ones show as "–"."""
+    return {
+        "hook_score": fmt(kpis['hook_score'], ".0f", "%"),
+        "packaging_score": fmt(kpis['packaging_score'], ".0f"),
+        "engagement_efficiency": fmt(kpis['engagement_efficiency'], ".1f"),
+        "avg_ctr": fmt(kpis['avg_ctr'], ".1f", "%"),
+    }
+
+def above(value, threshold):
+    return not is_missing(value) and value > threshold
+
 @mcp.tool(app=True)
 def analyze_video_performance(video_id: str):
     """
@@ -17,17 +31,18 @@ def analyze_video_performance(video_id: str):
         
         if not analysis:
             return f"Video {video_id} not found."
+        shown = fmt_kpis(analysis)
 
         return {
             "type": "PrefabApp",
             "title": f"Deep Dive: {analysis['title']}",
             "components": [
-                {"type": "Metric", "label": "Packaging Efficiency", "value": analysis['packaging_score'], "status": "good" if float(analysis['packaging_score']) > 80 else "bad"},
-                {"type": "Metric", "label": "Hook Quality", "value": analysis['hook_score'], "status": "good" if float(analysis['hook_score'].strip('%')) > 65 else "bad"},
+                {"type": "Metric", "label": "Packaging Efficiency", "value": shown['packaging_score'], "status": "good" if above(analysis['packaging_score'], 80) else "bad"},
+                {"type": "Metric", "label": "Hook Quality", "value": shown['hook_score'], "status": "good" if above(analysis['hook_score'], 65) else "bad"},
                 {"type": "Callout", "title": "AI Insight", "text": analysis['recommendation'], "variant": "info"},
                 {"type": "Table", "headers": ["Stat", "Value"], "rows": [
                     ["Views", f"{analysis['total_views']:,}"],
-                    ["Engagement Rate", analysis['engagement_efficiency']],
+                    ["Engagement Rate", shown['engagement_efficiency']],
                     ["Status", analysis['status']]
                 ]}
             ]
@@ -45,6 +60,7 @@ def compare_videos(video_id_1: str, video_id_2: str):
         engine = IntelligenceEngine(db)
         v1 = engine.get_video_kpis(video_id_1)
         v2 = engine.get_video_kpis(video_id_2)
+        s1, s2 = fmt_kpis(v1), fmt_kpis(v2)
         
         return {
             "type": "PrefabApp",
@@ -52,9 +68,9 @@ def compare_videos(video_id_1: str, video_id_2: str):
             "components": [
                 {"type": "Table", "headers": ["Metric", v1['title'][:20], v2['title'][:20]], "rows": [
                     ["Views", str(v1['total_views']), str(v2['total_views'])],
-                    ["Packaging", v1['packaging_score'], v2['packaging_score']],
-                    ["Hook", v1['hook_score'], v2['hook_score']],
-                    ["Eng. Efficiency", v1['engagement_efficiency'], v2['engagement_efficiency']]
+                    ["Packaging", s1['packaging_score'], s2['packaging_score']],
+                    ["Hook", s1['hook_score'], s2['hook_score']],
+                    ["Eng. Efficiency", s1['engagement_efficiency'], s2['engagement_efficiency']]
                 ]},
                 {"type": "Callout", "title": "Winner", "text": f"{v1['title'] if v1['total_views'] > v2['total_views'] else v2['title']} has higher reach.", "variant": "success"}
             ]
@@ -74,4 +90,5 @@ def list_my_videos():
         db.close()
 
 if __name__ == "__main__":
+    upgrade()
     mcp.run()
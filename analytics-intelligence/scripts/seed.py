@@ -1,10 +1,11 @@
 import random
 from datetime import datetime, timedelta
-from db.database import Base, engine, SessionLocal
+from db.database import SessionLocal
+from db.migrations import upgrade
 from db.models import Video, DailyMetric, RetentionData, VideoType
 
 def seed():
-    Base.metadata.create_all(bind=engine)
+    upgrade()
     db = SessionLocal()
 
     # Check if already seeded
@@ -14,15 +15,15 @@ def seed():
         return
 
     sample_videos = [
-        ("vid_001", "I Built an AI Office with 12 Agents", VideoType.long, 15200, "78%", "92", "12.4", "5.2%",
+        ("vid_001", "I Built an AI Office with 12 Agents", VideoType.long, 15200, 78.0, 92.0, 12.4, 5.2,
          "Strong hook but CTR could improve. Try Thumbnail Variant B with a shocked face close-up."),
-        ("vid_002", "MCP Servers Explained in 60 Seconds", VideoType.short, 45000, "65%", "110", "8.2", "8.1%",
+        ("vid_002", "MCP Servers Explained in 60 Seconds", VideoType.short, 45000, 65.0, 110.0, 8.2, 8.1,
          "Excellent packaging. The title/thumbnail combo is driving high CTR. Double down on MCP content."),
-        ("vid_003", "Why Streamlit is Perfect for AI Tools", VideoType.long, 8300, "81%", "75", "15.1", "3.8%",
+        ("vid_003", "Why Streamlit is Perfect for AI Tools", VideoType.long, 8300, 81.0, 75.0, 15.1, 3.8,
          "Low views but high engagement. Algorithm hasn't picked it up yet. Share on Reddit/HN for initial push."),
-        ("vid_004", "AI Agent Automates My Entire YouTube Workflow", VideoType.short, 67000, "72%", "135", "6.5", "9.4%",
+        ("vid_004", "AI Agent Automates My Entire YouTube Workflow", VideoType.short, 67000, 72.0, 135.0, 6.5, 9.4,
          "Viral potential confirmed. Highest CTR in the catalog. Make a part 2 asap."),
-        ("vid_005", "Hermes vs Claude Code: Which is Better?", VideoType.long, 12000, "55%", "68", "9.8", "4.1%",
+        ("vid_005", "Hermes vs Claude Code: Which is Better?", VideoType.long, 12000, 55.0, 68.0, 9.8, 4.1,
          "Hook needs work — 45% drop-off in first 3 seconds. Start with a bold claim or surprising demo."),
     ]
 
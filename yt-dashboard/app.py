@@ -1,17 +1,38 @@
 """YouTube Channel Dashboard for @thevibecoder69 — built with Streamlit."""
 
+import html
+import json
+import logging
 import os
 import pathlib
-import sys
+import time
 from typing import Optional
 
+_RUN_START = time.perf_counter()
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
 
 # ── Load env ──────────────────────────────────────────────────────────────
+# Before the yt_* imports: yt_quota and yt_cache read their settings at import time
 load_dotenv()
 
+from yt_quota import QuotaExceededError, get_request_stats  # noqa: E402
+from yt_timing import cache_miss, finish_run, span, start, start_run  # noqa: E402
+
+# First run in a process pays for these; later reruns find them in sys.modules
+_IMPORTS_DONE = time.perf_counter()
+logger = logging.getLogger("yt_dashboard")
+if not logger.handlers:
+    # Timing spans and boot timings go out as one JSON object per line
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(os.getenv("YT_LOG_LEVEL", "INFO").upper())
+run = start_run()
+
 # ── Page config ───────────────────────────────────────────────────────────
 _FAVICON = str(pathlib.Path(__file__).parent / "favicon.png")
 
@@ -81,6 +102,30 @@ st.markdown(
     a.metric-link:hover {
         text-decoration: none;
     }
+    .vc-row {
+        display: flex;
+        gap: 16px;
+        align-items: flex-start;
+        padding: 12px 0;
+        border-bottom: 1px solid rgba(160, 160, 176, 0.25);
+    }
+    .vc-row.vc-explorer {
+        flex-wrap: wrap;
+        border-bottom: none;
+    }
+    .vc-meta {
+        flex: 1;
+        min-width: 0;
+    }
+    .vc-title {
+        font-size: 1.25rem;
+        font-weight: 600;
+        margin-bottom: 6px;
+    }
+    .vc-caption {
+        font-size: 0.85rem;
+        color: #a0a0b0;
+    }
 </style>
 """,
     unsafe_allow_html=True,
@@ -117,19 +162,485 @@ def metric_card(label: str, value: str, delta: Optional[str] = None, video_id: O
     st.markdown(card_html, unsafe_allow_html=True)
 
 
-def embed_video(video_id: str, width: int = 320, height: int = 180):
-    """Render an embedded YouTube video iframe."""
-    st.markdown(
-        f"""
-        <iframe width="{width}" height="{height}"
-            src="https://www.youtube.com/embed/{video_id}"
-            title="YouTube video player" frameborder="0"
-            allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture"
-            allowfullscreen
-            style="border-radius: 8px;">
-        </iframe>
-        """,
-        unsafe_allow_html=True,
+@st.cache_resource(show_spinner=False)
+def thumbnail_proxy() -> str:
+    """Start the local thumbnail proxy once per process; returns its base URL or ""."""
+    from yt_thumbs import start_server
+
+    return start_server()
+
+
+def thumb_urls(ids: pd.Series, thumbs: pd.Series, width: int) -> pd.Series:
+    """Thumbnail URLs for `width` px cards: resized variants from the proxy when it's running."""
+    base = thumbnail_proxy()
+    if base:
+        from yt_thumbs import video_thumb_url
+
+        return ids.astype(str).map(lambda video_id: video_thumb_url(base, video_id, width))
+    thumbs = thumbs.fillna("").astype(str)
+    return thumbs.where(thumbs != "", "https://i.ytimg.com/vi/" + ids.astype(str) + "/hqdefault.jpg")
+
+
+def image_url(url: str, width: int) -> str:
+    """Proxied URL for a channel image shown at `width` px (the original if not proxied)."""
+    from yt_thumbs import image_url as proxied
+
+    return proxied(thumbnail_proxy(), url, width)
+
+
+def embed_video(video_id: str, width: int = 320, height: int = 180, thumbnail: str = ""):
+    """Render a click-to-load YouTube player.
+
+    Shows only the thumbnail and a play button until clicked; the real
+    player (and its megabytes of JS) loads inside the frame on click.
+    """
+    st.markdown(video_facade(video_id, width, height, thumbnail), unsafe_allow_html=True)
+
+
+_FACADE_HEAD = html.escape(
+    "<style>*{margin:0;padding:0;overflow:hidden}html,body,a{display:block;height:100%}"
+    "a{position:relative}img{width:100%;height:100%;object-fit:cover}"
+    "span{position:absolute;inset:0;margin:auto;width:68px;height:48px;border-radius:12px;"
+    "background:rgba(255,0,0,.85);color:#fff;font:24px/48px sans-serif;text-align:center}</style>"
+    '<a href="https://www.youtube.com/embed/'
+)
+
+
+def video_facades(ids: pd.Series, thumbs: pd.Series, width: int = 320, height: int = 180) -> pd.Series:
+    """HTML for lightweight player facades (see embed_video), one per video."""
+    thumbs = thumb_urls(ids, thumbs, width)
+    # The image tag sits inside srcdoc, so its URL is escaped twice
+    doc = (
+        _FACADE_HEAD
+        + ids.astype(str)
+        + html.escape('?autoplay=1"><img src="')
+        + thumbs.map(html.escape).map(html.escape)
+        + html.escape('" loading="lazy" alt=""><span>▶</span></a>')
+    )
+    return (
+        f'<iframe width="{width}" height="{height}" srcdoc="'
+        + doc
+        + '" loading="lazy" title="YouTube video player" frameborder="0"'
+        ' allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture"'
+        ' allowfullscreen style="border-radius: 8px;"></iframe>'
+    )
+
+
+def video_facade(video_id: str, width: int = 320, height: int = 180, thumbnail: str = "") -> str:
+    """HTML for a single player facade."""
+    return video_facades(pd.Series([video_id]), pd.Series([thumbnail]), width, height).iloc[0]
+
+
+# ── Batched card rendering ────────────────────────────────────────────────
+# Each list below is built column-wise for a whole page and sent as one
+# markdown element, instead of several Streamlit elements per video.
+def _fmt_counts(s: pd.Series, na: str = "N/A") -> pd.Series:
+    return s.astype("Float64").map("{:,.0f}".format, na_action="ignore").fillna(na).astype(str)
+
+
+def _fmt_ratios(s: pd.Series) -> pd.Series:
+    return s.astype("Float64").map("{:.2%}".format, na_action="ignore").fillna("N/A").astype(str)
+
+
+def _card_fields(df: pd.DataFrame) -> pd.DataFrame:
+    """Display strings for every column the card layouts use, computed per column."""
+    secs = df["duration_seconds"].astype("Float64").fillna(0)
+    minutes = (secs // 60).astype("int64").astype(str)
+    seconds = (secs % 60).astype("int64").astype(str).str.zfill(2)
+    desc = df["description"].fillna("").astype(str)
+    return pd.DataFrame(
+        {
+            "id": df["id"].astype(str),
+            "url": "https://www.youtube.com/watch?v=" + df["id"].astype(str),
+            "title": df["title"].fillna("Untitled").astype(str).map(html.escape),
+            "thumbnail": df["thumbnail"].fillna("").astype(str),
+            "views": _fmt_counts(df["views"]),
+            "views_or_zero": _fmt_counts(df["views"], na="0"),
+            "likes": _fmt_counts(df["likes"]),
+            "comments": _fmt_counts(df["comments"]),
+            "like_ratio": _fmt_ratios(df["like_view_ratio"]),
+            "comment_ratio": _fmt_ratios(df["comment_view_ratio"]),
+            "duration": (minutes + ":" + seconds).where(secs > 0, "N/A"),
+            "published": df["published_at"].dt.strftime("%b %d, %Y").fillna("N/A").astype(str),
+            "short_desc": (
+                desc.str.slice(0, 200).map(html.escape) + desc.str.len().gt(200).map({True: "…", False: ""})
+            ),
+        },
+        index=df.index,
+    )
+
+
+def overview_cards_html(df: pd.DataFrame) -> str:
+    """Public Overview rows: player facade beside title and a stats line."""
+    f = _card_fields(df)
+    rows = (
+        '<div class="vc-row"><div>'
+        + video_facades(f["id"], f["thumbnail"], 240, 135)
+        + '</div><div class="vc-meta"><div class="vc-title"><a href="'
+        + f["url"]
+        + '" target="_blank">'
+        + f["title"]
+        + '</a></div><div class="vc-caption">👁 '
+        + f["views"]
+        + " views &nbsp;|&nbsp; 👍 "
+        + f["likes"]
+        + " &nbsp;|&nbsp; 💬 "
+        + f["comments"]
+        + " &nbsp;|&nbsp; 📊 "
+        + f["like_ratio"]
+        + " like/view &nbsp;|&nbsp; 💭 "
+        + f["comment_ratio"]
+        + " comment/view &nbsp;|&nbsp; 📅 "
+        + f["published"]
+        + "</div></div></div>"
+    )
+    return "".join(rows)
+
+
+def explorer_cards_html(df: pd.DataFrame) -> str:
+    """Video Explorer cards: linked thumbnail, meta, stat chips, description and player."""
+    f = _card_fields(df)
+    thumb_src = thumb_urls(f["id"], f["thumbnail"], 240).map(html.escape)
+    thumb = ('<a href="' + f["url"] + '" target="_blank"><img src="' + thumb_src
+             + '" width="240" class="ve-thumb"></a>').where(
+        f["thumbnail"] != "",
+        '<div style="width:240px;height:135px;background:#f0f0f0;border-radius:8px;display:flex;'
+        'align-items:center;justify-content:center;font-size:2rem;">🎬</div>',
+    )
+    desc = ('<div class="ve-desc">' + f["short_desc"] + "</div>").where(f["short_desc"] != "", "")
+    rows = (
+        '<div class="vc-row vc-explorer"><div>'
+        + thumb
+        + '</div><div class="vc-meta"><div class="ve-title"><a href="'
+        + f["url"]
+        + '" target="_blank">'
+        + f["title"]
+        + '</a></div><div class="ve-meta"><span>👁 '
+        + f["views_or_zero"]
+        + " views</span><span>👍 "
+        + f["likes"]
+        + "</span><span>💬 "
+        + f["comments"]
+        + "</span><span>⏱ "
+        + f["duration"]
+        + "</span><span>📅 "
+        + f["published"]
+        + '</span></div><div><span class="ve-stat-chip ve-stat-views">👁 '
+        + f["views_or_zero"]
+        + '</span><span class="ve-stat-chip ve-stat-likes">👍 '
+        + f["likes"]
+        + '</span><span class="ve-stat-chip ve-stat-comments">💬 '
+        + f["comments"]
+        + '</span><span class="ve-stat-chip ve-stat-ratio">📊 '
+        + f["like_ratio"]
+        + "</span></div>"
+        + desc
+        + "</div></div><div>"
+        + video_facades(f["id"], f["thumbnail"], 320, 180)
+        + "</div><hr>"
+    )
+    return "".join(rows)
+
+
+def raw_cards_html(df: pd.DataFrame) -> str:
+    """Raw Data Table rows: player facade beside title and a compact stats line."""
+    f = _card_fields(df)
+    rows = (
+        '<div class="vc-row"><div>'
+        + video_facades(f["id"], f["thumbnail"], 240, 135)
+        + '</div><div class="vc-meta"><div class="vc-title"><a href="'
+        + f["url"]
+        + '" target="_blank">'
+        + f["title"]
+        + '</a></div><div class="vc-caption">👁 '
+        + _fmt_counts(df["views"], na="0")
+        + " views | 👍 "
+        + _fmt_counts(df["likes"], na="0")
+        + " | 💬 "
+        + _fmt_counts(df["comments"], na="0")
+        + " | ⏱ "
+        + f["duration"]
+        + " | 📅 "
+        + f["published"]
+        + "</div></div></div>"
+    )
+    return "".join(rows)
+
+
+PAGE_SIZES = (10, 25, 50)
+
+
+def paginate(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Render page-size and page controls and return the current page of `df`."""
+    c_size, c_page, c_info = st.columns([1, 1, 3])
+    size = c_size.selectbox("Per page", PAGE_SIZES, key=f"{key}_page_size")
+    pages = max(1, -(-len(df) // size))
+    # Filters can shrink the result below the page the user was on
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    page = c_page.number_input("Page", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+    start = (page - 1) * size
+    end = min(start + size, len(df))
+    c_info.caption(f"Showing {start + 1 if len(df) else 0}–{end} of {len(df)} • page {page} of {pages}")
+    return df.iloc[start:end]
+
+
+# ── Video Explorer indexes ────────────────────────────────────────────────
+# Sort chips: label → (column, ascending)
+SORT_OPTIONS = {
+    "📅 Newest": ("published_at", False),
+    "📅 Oldest": ("published_at", True),
+    "👁 Most Views": ("views", False),
+    "👁 Least Views": ("views", True),
+    "👍 Most Likes": ("likes", False),
+    "📊 Best Like/View": ("like_view_ratio", False),
+    # Search relevance; falls back to newest first when there is no search
+    "🎯 Best Match": None,
+}
+DEFAULT_SORT, SEARCH_SORT = "📅 Newest", "🎯 Best Match"
+# Quick filter chips: ("top", col) keeps the 10 largest by col (in that order),
+# ("upper_quartile", col) keeps rows above the 75th percentile of col.
+QUICK_FILTERS = {
+    "🔥 Top 10 by Views": ("top", "views"),
+    "📈 Top 10 by Likes": ("top", "likes"),
+    "💬 Top 10 by Comments": ("top", "comments"),
+    "⭐ High Engagement": ("upper_quartile", "like_view_ratio"),
+    "🔄 Show All": None,
+}
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def explorer_index(version: str, _videos: pd.DataFrame) -> dict:
+    """Sort permutations and quick-filter masks for one dataset version.
+
+    Built once per snapshot and shared by all sessions, so chip clicks only
+    slice precomputed position arrays.
+    """
+    cache_miss()
+    df = _videos.reset_index(drop=True)
+    orders = {
+        label: df[col].sort_values(ascending=asc, na_position="last", kind="stable").index.to_numpy()
+        for label, spec in SORT_OPTIONS.items()
+        if spec is not None
+        for col, asc in [spec]
+    }
+    # Largest first with missing values dropped, like DataFrame.nlargest
+    ranked = {
+        col: df[col].dropna().sort_values(ascending=False, kind="stable").index.to_numpy()
+        for kind, col in filter(None, QUICK_FILTERS.values())
+        if kind == "top"
+    }
+    quartile = {}
+    for kind, col in filter(None, QUICK_FILTERS.values()):
+        if kind == "upper_quartile":
+            values = df[col].astype("float64").to_numpy()
+            quartile[col] = (values, _above_upper_quartile(values))
+    return {"orders": orders, "ranked": ranked, "quartile": quartile, "position": pd.Index(df["id"])}
+
+
+def _above_upper_quartile(values: np.ndarray) -> np.ndarray:
+    if np.isnan(values).all():
+        return np.ones(len(values), dtype=bool)
+    return values > np.nanquantile(values, 0.75)
+
+
+def explorer_positions(index: dict, sort_label: str, filter_label: str, hits: Optional[np.ndarray]) -> np.ndarray:
+    """Row positions to show, given the chips and optional search hits (positions, best first)."""
+    match = None
+    if hits is not None:
+        match = np.zeros(len(index["position"]), dtype=bool)
+        match[hits] = True
+
+    spec = QUICK_FILTERS[filter_label]
+    if spec and spec[0] == "top":
+        ranked = index["ranked"][spec[1]]
+        if match is not None:
+            ranked = ranked[match[ranked]]
+        return ranked[:10]
+
+    if SORT_OPTIONS[sort_label] is None:
+        order = hits if hits is not None else index["orders"][DEFAULT_SORT]
+    else:
+        order = index["orders"][sort_label]
+    keep = match
+    if spec and spec[0] == "upper_quartile":
+        values, mask = index["quartile"][spec[1]]
+        if match is not None:
+            # The quartile is taken over the search results, not the whole channel
+            mask = np.zeros(len(values), dtype=bool)
+            mask[match] = _above_upper_quartile(values[match])
+            keep = match & mask
+        else:
+            keep = mask
+    return order if keep is None else order[keep[order]]
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def search_index(channel_id: str, max_videos: int):
+    """Full-text index for one (channel, max_videos) snapshot key, shared by all sessions.
+
+    Kept across refreshes so a new dataset version only re-indexes the
+    videos that changed; search it with SearchIndex.search_version().
+    """
+    cache_miss()
+    from yt_search import SearchIndex
+
+    return SearchIndex()
+
+
+# ── Charts ────────────────────────────────────────────────────────────────
+# Chart specs are built from pre-aggregated, downsampled data (yt_charts)
+# once per dataset version and shared by all sessions.
+@st.cache_resource(max_entries=16, show_spinner=False)
+def top_views_data(version: str, _videos: pd.DataFrame) -> pd.DataFrame:
+    cache_miss()
+    from yt_charts import top_n
+
+    top10 = top_n(_videos, "views", 10, title_len=40)
+    # Make titles clickable
+    top10["Title"] = "[" + top10["title_short"] + "](https://www.youtube.com/watch?v=" + top10["id"] + ")"
+    return top10[["Title", "views"]].set_index("Title")
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def engagement_chart(version: str, _videos: pd.DataFrame):
+    cache_miss()
+    import altair as alt
+
+    from yt_charts import thin_scatter
+
+    scatter_data = thin_scatter(_videos[["views", "likes", "title", "id"]], "views", "likes").copy()
+    scatter_data["url"] = "https://www.youtube.com/watch?v=" + scatter_data["id"].astype(str)
+    scatter_data["title_short"] = scatter_data["title"].str[:40]
+    return (
+        alt.Chart(scatter_data[["views", "likes", "title_short", "url"]])
+        .mark_circle(size=80, opacity=0.7)
+        .encode(
+            x=alt.X("views:Q", title="Views"),
+            y=alt.Y("likes:Q", title="Likes"),
+            tooltip=[
+                alt.Tooltip("title_short:N", title="Video"),
+                alt.Tooltip("views:Q", title="Views", format=","),
+                alt.Tooltip("likes:Q", title="Likes", format=","),
+            ],
+            href="url:N",
+            color=alt.Color("likes:Q", scale=alt.Scale(scheme="reds"), legend=None),
+        )
+        .interactive()
+        .properties(height=400)
+    )
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def views_over_time_chart(version: str, resolution: str, _videos: pd.DataFrame):
+    cache_miss()
+    import altair as alt
+
+    from yt_charts import views_over_time
+
+    time_df = views_over_time(_videos, resolution)
+    if resolution == "Per video":
+        tooltip = [
+            alt.Tooltip("title:N", title="Video"),
+            alt.Tooltip("views:Q", title="Views", format=","),
+            alt.Tooltip("published_at:T", title="Date"),
+        ]
+        extra = {"href": "url:N"}
+        time_df = time_df.assign(url="https://www.youtube.com/watch?v=" + time_df["id"].astype(str))
+        time_df = time_df[["published_at", "views", "title", "url"]]
+    else:
+        tooltip = [
+            alt.Tooltip("published_at:T", title=f"{resolution} from"),
+            alt.Tooltip("views:Q", title="Views", format=","),
+            alt.Tooltip("videos:Q", title="Videos"),
+            alt.Tooltip("avg_views:Q", title="Avg views / video", format=","),
+        ]
+        extra = {}
+    return (
+        alt.Chart(time_df)
+        .mark_line(point=True, color="#ff6b6b")
+        .encode(
+            x=alt.X("published_at:T", title="Published Date"),
+            y=alt.Y("views:Q", title="Views"),
+            tooltip=tooltip,
+            **extra,
+        )
+        .interactive()
+        .properties(height=300)
+    )
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def history_charts(version: str, _videos: pd.DataFrame):
+    """Growth (top 5) and velocity charts from the snapshot history, or None if too little of it."""
+    cache_miss()
+    import altair as alt
+
+    from yt_charts import downsample_history, top_n, view_velocity
+    from yt_history import read_snapshots
+
+    history = read_snapshots(video_ids=_videos["id"].tolist())
+    if history["timestamp"].nunique() < 2:
+        return None
+    titles = _videos[["id", "title"]].rename(columns={"id": "video_id"})
+    titles["title_short"] = titles["title"].str[:30]
+
+    top_ids = top_n(_videos, "views", 5)["id"].tolist()
+    growth = downsample_history(history[history["video_id"].isin(top_ids)]).merge(titles, on="video_id")
+    growth_chart = (
+        alt.Chart(growth[["timestamp", "views", "title", "title_short"]])
+        .mark_line(point=True)
+        .encode(
+            x=alt.X("timestamp:T", title="Snapshot"),
+            y=alt.Y("views:Q", title="Views"),
+            color=alt.Color("title_short:N", title="Video"),
+            tooltip=[
+                alt.Tooltip("title:N", title="Video"),
+                alt.Tooltip("views:Q", title="Views", format=","),
+                alt.Tooltip("timestamp:T", title="Snapshot"),
+            ],
+        )
+        .properties(height=300)
+    )
+
+    velocity = view_velocity(history, 10).merge(titles, on="video_id")
+    velocity_chart = (
+        alt.Chart(velocity[["views_per_day", "title", "title_short"]])
+        .mark_bar(color="#ff6b6b")
+        .encode(
+            x=alt.X("views_per_day:Q", title="Views / day"),
+            y=alt.Y("title_short:N", title="", sort="-x"),
+            tooltip=[
+                alt.Tooltip("title:N", title="Video"),
+                alt.Tooltip("views_per_day:Q", title="Views / day", format=",.0f"),
+            ],
+        )
+        .properties(height=300)
+    )
+    return growth_chart, velocity_chart
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def distribution_chart(version: str, column: str, color: str, _videos: pd.DataFrame):
+    """Horizontal bars for the 15 videos with the most `column`."""
+    cache_miss()
+    import altair as alt
+
+    from yt_charts import top_n
+
+    data = top_n(_videos, column, 15)
+    return (
+        alt.Chart(data[["title", "title_short", column]])
+        .mark_bar(color=color)
+        .encode(
+            x=alt.X(f"{column}:Q", title=column.title()),
+            y=alt.Y("title_short:N", title="", sort="-x"),
+            tooltip=[
+                alt.Tooltip("title:N", title="Video"),
+                alt.Tooltip(f"{column}:Q", title=column.title(), format=","),
+            ],
+        )
+        .properties(height=400)
     )
 
 
@@ -162,9 +673,9 @@ def video_card(video: dict, expand_desc: bool = False):
         unsafe_allow_html=True,
     )
 
-    # Embedded video player
+    # Click-to-load video player
     if vid:
-        embed_video(vid, width=400, height=225)
+        embed_video(vid, width=400, height=225, thumbnail=video.get("thumbnail", ""))
 
     desc = video.get("description", "")
     if desc:
@@ -196,15 +707,22 @@ def video_table_row(video: dict):
     st.caption(f"👁 {views:,} | 👍 {likes:,} | 💬 {comments:,} | 📅 {published}")
 
 
-# ── Data loading (moved after sidebar for slider access) ──────────────────
-@st.cache_data(ttl=300, show_spinner=False)
-def load_data(channel_id: str, max_v: int):
-    """Load channel info and videos with caching."""
-    from yt_api import get_channel_info, get_channel_videos_df
-
-    channel = get_channel_info(channel_id)
-    videos_df = get_channel_videos_df(channel_id, max_v)
-    return channel, videos_df
+def video_preview(videos: pd.DataFrame, limit: int = 50):
+    """Render a lightweight list of videos as a single element (used while streaming)."""
+    rows = []
+    videos = videos.head(limit)
+    thumbs = thumb_urls(videos["id"], videos["thumbnail"], 120)
+    for vid, title, thumb, views in zip(videos["id"], videos["title"], thumbs, videos["views"]):
+        url = html.escape(f"https://www.youtube.com/watch?v={vid}")
+        title = html.escape(str(title) if pd.notna(title) else "Untitled")
+        views_d = f"{int(views):,}" if pd.notna(views) else "N/A"
+        thumb_html = f'<img src="{html.escape(thumb)}" width="120" style="border-radius: 6px; float: left; margin-right: 12px;">' if thumb else ""
+        rows.append(
+            f'<div class="video-card" style="overflow: hidden;">{thumb_html}'
+            f'<div class="video-title"><a href="{url}" target="_blank" style="color: #e0aaff; text-decoration: none;">{title}</a></div>'
+            f'<div class="video-stats">👁 {views_d} views</div></div>'
+        )
+    st.markdown("".join(rows), unsafe_allow_html=True)
 
 
 # ── Sidebar ───────────────────────────────────────────────────────────────
@@ -214,7 +732,7 @@ with st.sidebar:
     _ch = globals().get("channel", {})
     _thumb_url = _ch.get("thumbnail", "") if isinstance(_ch, dict) else ""
     if _thumb_url:
-        st.image(_thumb_url, width=120, use_container_width=False)
+        st.image(image_url(_thumb_url, 120), width=120, use_container_width=False)
     else:
         st.markdown(
             "<div style='width:120px;height:120px;background:linear-gradient(135deg,#ff6b6b,#e0aaff);"
@@ -254,28 +772,99 @@ with st.sidebar:
             os.environ["YOUTUBE_CHANNEL_ID"] = channel_input
 
         max_videos = st.slider("Max videos to fetch", 10, 100, 50)
+        debug_timings = st.toggle("🐞 Debug timings", key="debug_timings", help="Show where this rerun spent its time")
 
     st.divider()
     st.caption("Built with ❤️ by The Office team")
 
 
 # ── Data loading ──────────────────────────────────────────────────────────
-@st.cache_data(ttl=300, show_spinner=False)
-def load_data(channel_id: str, max_v: int):
-    """Load channel info and videos with caching."""
+def fetch_data(channel_id: str, max_v: int):
+    """Fetch channel info and videos from the API (used by the background refresher)."""
     from yt_api import get_channel_info, get_channel_videos_df
 
-    channel = get_channel_info(channel_id)
-    videos_df = get_channel_videos_df(channel_id, max_v)
+    channel = get_channel_info(channel_id, projection="header")
+    videos_df = get_channel_videos_df(channel_id, max_v, incremental=True)
     return channel, videos_df
 
 
+@st.cache_resource(show_spinner=False)
+def get_refresher():
+    """One background refresher per server process, shared by all sessions."""
+    from yt_refresh import Refresher
+
+    return Refresher(fetch_data)
+
+
+def load_data(channel_id: str, max_v: int):
+    """Return the last good snapshot; only a channel's very first load waits on the API."""
+    with span("load_data", cache=True, channel=channel_id, max_videos=max_v) as load_span:
+        snapshot = get_refresher().get(channel_id, max_v)
+        load_span.attrs.update(snapshot_age_s=round(snapshot.age), version=snapshot.version)
+    return snapshot
+
+
+def freshness_caption(snapshot) -> str:
+    """Human-readable age of a snapshot, flagging a failed background refresh."""
+    minutes = int(snapshot.age // 60)
+    if minutes < 1:
+        age = "just now"
+    elif minutes < 60:
+        age = f"{minutes} min ago"
+    else:
+        age = f"{minutes // 60} h {minutes % 60} min ago"
+    if snapshot.error:
+        return f"🟠 Updated {age} — latest refresh failed, showing last good data ({snapshot.error})"
+    return f"🟢 Updated {age}"
+
+
+@st.cache_resource(show_spinner=False)
+def boot_timings() -> dict:
+    """Timings of the first script run in this process, filled in at its end."""
+    return {}
+
+
+# Views that preview videos while a cold channel streams in page by page
+STREAMING_VIEWS = ("📊 Public Overview", "🎥 Video Explorer")
+
+
+def stream_first_paint(channel_id: str, max_v: int):
+    """Fetch a never-synced channel page by page, previewing videos as they arrive.
+
+    Each batch is written to the incremental sync store, so the load_data
+    call that follows only has to read it back.
+    """
+    from yt_api import iter_channel_videos
+
+    placeholder = st.empty()
+    batches = []
+    for batch in iter_channel_videos(channel_id, max_v, store=True):
+        batches.append(batch)
+        loaded = pd.concat(batches).sort_values("published_at", ascending=False)
+        with placeholder.container():
+            st.caption(f"⏳ Loading videos… {len(loaded)} of up to {max_v} so far")
+            video_preview(loaded)
+    placeholder.empty()
+
+
 # ── Main content ──────────────────────────────────────────────────────────
 try:
-    channel, videos_df = load_data(
-        os.getenv("YOUTUBE_CHANNEL_ID", "@thevibecoder69"),
-        max_videos,
-    )
+    _channel_id = os.getenv("YOUTUBE_CHANNEL_ID", "@thevibecoder69")
+    # yt_api (and googleapiclient) is only imported when there is no snapshot to serve
+    if view in STREAMING_VIEWS and not get_refresher().has_snapshot(_channel_id, max_videos):
+        from yt_api import has_synced_videos
+
+        if not has_synced_videos(_channel_id):
+            with span("stream_first_paint", channel=_channel_id, max_videos=max_videos):
+                stream_first_paint(_channel_id, max_videos)
+    _data_start = time.perf_counter()
+    snapshot = load_data(_channel_id, max_videos)
+    channel, videos_df = snapshot.channel, snapshot.videos
+    _data_done = time.perf_counter()
+except QuotaExceededError as e:
+    st.error(f"⚠️ {e}")
+    st.info("Cached data will be shown again once quota is available.")
+    st.stop()
 except ValueError as e:
     st.error(f"⚠️ {e}")
     st.info(
@@ -287,12 +876,36 @@ except Exception as e:
     st.error(f"Error loading data: {e}")
     st.stop()
 
+# ── API usage (sidebar, filled after loading so it reflects this run) ─────
+with st.sidebar:
+    with st.expander("📶 API Usage"):
+        usage = get_request_stats()
+        st.caption(
+            f"{usage['units_used']:,} units used since startup • "
+            f"{usage['budget_remaining']:,} / {usage['budget']:,} left in daily budget"
+        )
+        if usage["methods"]:
+            st.dataframe(
+                pd.DataFrame.from_dict(usage["methods"], orient="index")[
+                    ["calls", "cache_hits", "units", "errors", "retries", "avg_latency_ms"]
+                ],
+                use_container_width=True,
+            )
+        else:
+            st.caption("No API calls yet — everything was served from cache.")
+        boot = boot_timings()
+        if boot:
+            st.caption(
+                f"First run after startup: imports {boot['imports_ms']:,} ms • "
+                f"data {boot['data_ms']:,} ms • total {boot['total_ms']:,} ms"
+            )
+
 # ── Channel header ────────────────────────────────────────────────────────
 col_thumb, col_info = st.columns([1, 5])
 with col_thumb:
     _header_thumb = channel.get("thumbnail", "") if isinstance(channel, dict) else ""
     if _header_thumb:
-        st.image(_header_thumb, width=120, use_container_width=False, output_format="PNG")
+        st.image(image_url(_header_thumb, 120), width=120, use_container_width=False, output_format="PNG")
     else:
         st.markdown(
             "<div style='width:120px;height:120px;background:linear-gradient(135deg,#ff6b6b,#e0aaff);"
@@ -304,6 +917,7 @@ with col_info:
     st.title(f"🎬 {channel['title']}")
     if channel.get("custom_url"):
         st.caption(f"youtube.com/{channel['custom_url']}")
+    st.caption(freshness_caption(snapshot))
     desc = channel.get("description", "")
     if desc:
         with st.expander("Channel Description"):
@@ -318,6 +932,7 @@ if not videos_df.empty and "id" in videos_df.columns:
     top_video_id = videos_df.loc[top_idx, "id"]
 
 # ── View routing ──────────────────────────────────────────────────────────
+_view_span = start("view", view=view)
 if view == "📊 Public Overview":
     # ── Key metrics row ───────────────────────────────────────────────────
     # Each metric card is clickable and opens the top video on YouTube
@@ -340,92 +955,23 @@ if view == "📊 Public Overview":
     if not videos_df.empty:
         st.subheader("📋 Recent Videos Performance")
 
-        for _, row in videos_df.sort_values("published_at", ascending=False).iterrows():
-            video = row.to_dict()
-            vid = video.get("id", "")
-            url = f"https://www.youtube.com/watch?v={vid}"
-            title = video.get("title", "Untitled")
-            views = video.get("views")
-            likes = video.get("likes")
-            comments = video.get("comments")
-            like_ratio = video.get("like_view_ratio")
-            comment_ratio = video.get("comment_view_ratio")
-            published_at = video.get("published_at")
-            thumb = video.get("thumbnail", "")
-
-            pub_str = (
-                published_at.strftime("%b %d, %Y")
-                if pd.notna(published_at)
-                else "N/A"
-            )
-            views_str = f"{views:,}" if pd.notna(views) else "N/A"
-            likes_str = f"{likes:,}" if pd.notna(likes) else "N/A"
-            comments_str = f"{comments:,}" if pd.notna(comments) else "N/A"
-            like_ratio_str = f"{like_ratio:.2%}" if pd.notna(like_ratio) else "N/A"
-            comment_ratio_str = f"{comment_ratio:.2%}" if pd.notna(comment_ratio) else "N/A"
-
-            col_embed, col_meta = st.columns([1, 2])
-            with col_embed:
-                if vid:
-                    embed_video(vid, width=240, height=135)
-                elif thumb:
-                    st.markdown(
-                        f'<a href="{url}" target="_blank"><img src="{thumb}" width="240" style="border-radius:8px;"></a>',
-                        unsafe_allow_html=True,
-                    )
-            with col_meta:
-                st.markdown(f"### [{title}]({url})")
-                st.caption(
-                    f"👁 {views_str} views &nbsp;|&nbsp; "
-                    f"👍 {likes_str} &nbsp;|&nbsp; "
-                    f"💬 {comments_str} &nbsp;|&nbsp; "
-                    f"📊 {like_ratio_str} like/view &nbsp;|&nbsp; "
-                    f"💭 {comment_ratio_str} comment/view &nbsp;|&nbsp; "
-                    f"📅 {pub_str}"
-                )
-            st.divider()
+        recent = paginate(videos_df.sort_values("published_at", ascending=False), "ov")
+        with span("render.cards", layout="overview", rows=len(recent)):
+            st.markdown(overview_cards_html(recent), unsafe_allow_html=True)
 
         # ── Top videos chart ──────────────────────────────────────────────
         st.subheader("🏆 Top 10 Videos by Views")
-        top10 = videos_df.nlargest(10, "views")[["id", "title", "views"]].copy()
-        # Make titles clickable
-        top10["Title"] = top10.apply(
-            lambda row: f"[{row['title'][:40]}](https://www.youtube.com/watch?v={row['id']})",
-            axis=1,
-        )
-        chart_data = top10[["Title", "views"]].set_index("Title")
+        with span("chart.top_views", cache=True):
+            chart_data = top_views_data(snapshot.version, videos_df)
         st.bar_chart(chart_data, use_container_width=True)
 
         # ── Engagement scatter with video titles on hover ─────────────────
         st.subheader("💡 Engagement Overview")
         st.caption("Hover over points to see video titles. Click to open on YouTube.")
 
-        # Use Altair for proper hover tooltips with video names
-        import altair as alt
-
-        scatter_data = videos_df[["views", "likes", "title", "id"]].copy()
-        scatter_data["url"] = scatter_data["id"].apply(
-            lambda x: f"https://www.youtube.com/watch?v={x}"
-        )
-        scatter_data["title_short"] = scatter_data["title"].str[:40]
-
-        chart = (
-            alt.Chart(scatter_data)
-            .mark_circle(size=80, opacity=0.7)
-            .encode(
-                x=alt.X("views:Q", title="Views"),
-                y=alt.Y("likes:Q", title="Likes"),
-                tooltip=[
-                    alt.Tooltip("title_short:N", title="Video"),
-                    alt.Tooltip("views:Q", title="Views", format=","),
-                    alt.Tooltip("likes:Q", title="Likes", format=","),
-                ],
-                href="url:N",
-                color=alt.Color("likes:Q", scale=alt.Scale(scheme="reds"), legend=None),
-            )
-            .interactive()
-            .properties(height=400)
-        )
+        # Altair for proper hover tooltips with video names; large channels are thinned out
+        with span("chart.engagement", cache=True):
+            chart = engagement_chart(snapshot.version, videos_df)
         st.altair_chart(chart, use_container_width=True)
     else:
         st.info("No videos found for this channel.")
@@ -487,26 +1033,28 @@ elif view == "🎥 Video Explorer":
 
     if not videos_df.empty:
         # ── Search ──────────────────────────────────────────────────────────
-        search = st.text_input("🔍 Search videos", placeholder="Filter by title...", key="ve_search")
+        search = st.text_input(
+            "🔍 Search videos", placeholder="Search titles, descriptions and tags...", key="ve_search"
+        )
 
-        filtered = videos_df.copy()
+        with span("explorer_index", cache=True):
+            index = explorer_index(snapshot.version, videos_df)
+        hits = None
         if search:
-            mask = filtered["title"].str.contains(search, case=False, na=False)
-            filtered = filtered[mask]
+            with span("search_index", cache=True):
+                text_index = search_index(_channel_id, max_videos)
+            with span("search.query", chars=len(search)) as query_span:
+                ids = text_index.search_version(videos_df, snapshot.version, search)
+                hits = index["position"].get_indexer(ids)
+                # get_indexer marks IDs missing from this frame with -1
+                hits = hits[hits >= 0]
+                query_span.attrs["hits"] = len(hits)
 
         # ── Sort chips ──────────────────────────────────────────────────────
         st.caption("Sort by")
-        sort_options = {
-            "📅 Newest": ("published_at", False),
-            "📅 Oldest": ("published_at", True),
-            "👁 Most Views": ("views", False),
-            "👁 Least Views": ("views", True),
-            "👍 Most Likes": ("likes", False),
-            "📊 Best Like/View": ("like_view_ratio", False),
-        }
-        sort_labels = list(sort_options.keys())
+        sort_labels = list(SORT_OPTIONS.keys())
         sort_cols = st.columns(len(sort_labels))
-        sort_key = st.session_state.get("ve_sort", sort_labels[0])
+        sort_key = st.session_state.get("ve_sort", SEARCH_SORT if search else DEFAULT_SORT)
 
         for i, (label, col) in enumerate(zip(sort_labels, sort_cols)):
             is_active = sort_key == label
@@ -514,112 +1062,25 @@ elif view == "🎥 Video Explorer":
                 sort_key = label
                 st.session_state["ve_sort"] = sort_key
 
-        sort_col, sort_asc = sort_options[sort_key]
-        filtered = filtered.sort_values(
-            sort_col, ascending=sort_asc, na_position="last"
-        )
-
         # ── Quick filter chips ──────────────────────────────────────────────
         st.caption("Quick filters")
-        chip_cols = st.columns(5)
-        quick_filters = {
-            "🔥 Top 10 by Views": lambda df: df.nlargest(10, "views"),
-            "📈 Top 10 by Likes": lambda df: df.nlargest(10, "likes"),
-            "💬 Top 10 by Comments": lambda df: df.nlargest(10, "comments"),
-            "⭐ High Engagement": lambda df: df[df["like_view_ratio"] > df["like_view_ratio"].quantile(0.75)] if df["like_view_ratio"].notna().any() else df,
-            "🔄 Show All": lambda df: df,
-        }
+        chip_cols = st.columns(len(QUICK_FILTERS))
         active_filter = st.session_state.get("ve_filter", "🔄 Show All")
-        for i, (label, col) in enumerate(zip(quick_filters.keys(), chip_cols)):
+        for i, (label, col) in enumerate(zip(QUICK_FILTERS.keys(), chip_cols)):
             is_active = active_filter == label
             if col.button(label, key=f"filter_{i}", type="primary" if is_active else "secondary"):
                 active_filter = label
                 st.session_state["ve_filter"] = active_filter
 
-        filtered = quick_filters[active_filter](filtered)
+        filtered = videos_df.iloc[explorer_positions(index, sort_key, active_filter, hits)]
 
-        st.caption(f"Showing {len(filtered)} video{'s' if len(filtered) != 1 else ''}")
+        st.caption(f"{len(filtered)} video{'s' if len(filtered) != 1 else ''} match")
+        page_df = paginate(filtered, "ve")
         st.divider()
 
         # ── Horizontal video cards ──────────────────────────────────────────
-        for _, row in filtered.iterrows():
-            video = row.to_dict()
-            vid = video.get("id", "")
-            url = f"https://www.youtube.com/watch?v={vid}"
-            thumb = video.get("thumbnail", "")
-            title = video.get("title", "Untitled")
-            views = video.get("views") or 0
-            likes = video.get("likes")
-            comments = video.get("comments")
-            duration_s = video.get("duration_seconds", 0)
-            published_at = video.get("published_at")
-            desc = video.get("description", "")
-            like_ratio = video.get("like_view_ratio")
-
-            # Format duration
-            dur_str = (
-                f"{int(duration_s // 60)}:{int(duration_s % 60):02d}"
-                if duration_s
-                else "N/A"
-            )
-            # Format date
-            pub_str = (
-                published_at.strftime("%b %d, %Y")
-                if pd.notna(published_at)
-                else "N/A"
-            )
-            # Format ratio
-            ratio_str = f"{like_ratio:.2%}" if pd.notna(like_ratio) else "N/A"
-
-            col_thumb, col_meta = st.columns([1, 3])
-            with col_thumb:
-                if thumb:
-                    st.markdown(
-                        f'<a href="{url}" target="_blank">'
-                        f'<img src="{thumb}" width="240" class="ve-thumb"></a>',
-                        unsafe_allow_html=True,
-                    )
-                else:
-                    st.markdown(
-                        f'<div style="width:240px;height:135px;background:#f0f0f0;'
-                        f'border-radius:8px;display:flex;align-items:center;'
-                        f'justify-content:center;font-size:2rem;">🎬</div>',
-                        unsafe_allow_html=True,
-                    )
-            with col_meta:
-                st.markdown(
-                    f'<div class="ve-title"><a href="{url}" target="_blank">{title}</a></div>',
-                    unsafe_allow_html=True,
-                )
-                comments_display = f"{int(comments):,}" if pd.notna(comments) else "N/A"
-                st.markdown(
-                    f'<div class="ve-meta">'
-                    f'<span>👁 {views:,} views</span>'
-                    f'<span>👍 {f"{int(likes):,}" if pd.notna(likes) else "N/A"}</span>'
-                    f'<span>💬 {comments_display}</span>'
-                    f'<span>⏱ {dur_str}</span>'
-                    f'<span>📅 {pub_str}</span>'
-                    f"</div>",
-                    unsafe_allow_html=True,
-                )
-                st.markdown(
-                    f'<div>'
-                    f'<span class="ve-stat-chip ve-stat-views">👁 {views:,}</span>'
-                    f'<span class="ve-stat-chip ve-stat-likes">👍 {int(likes) if pd.notna(likes) else "N/A"}</span>'
-                    f'<span class="ve-stat-chip ve-stat-comments">💬 {comments_display}</span>'
-                    f'<span class="ve-stat-chip ve-stat-ratio">📊 {ratio_str}</span>'
-                    f"</div>",
-                    unsafe_allow_html=True,
-                )
-                if desc:
-                    short_desc = desc[:200] + ("…" if len(desc) > 200 else "")
-                    st.markdown(
-                        f'<div class="ve-desc">{short_desc}</div>',
-                        unsafe_allow_html=True,
-                    )
-            if vid:
-                embed_video(vid, width=320, height=180)
-            st.markdown("---")
+        with span("render.cards", layout="explorer", rows=len(page_df)):
+            st.markdown(explorer_cards_html(page_df), unsafe_allow_html=True)
     else:
         st.info("No videos found.")
 
@@ -629,67 +1090,41 @@ elif view == "📈 Analytics":
     if not videos_df.empty:
         # Views over time
         st.markdown("### 📅 Views Over Time")
-        time_df = videos_df[["id", "published_at", "views", "title"]].sort_values("published_at").copy()
-        time_df["published_at"] = time_df["published_at"].dt.strftime("%Y-%m-%d")
-
-        import altair as alt
-
-        line_chart = (
-            alt.Chart(time_df)
-            .mark_line(point=True, color="#ff6b6b")
-            .encode(
-                x=alt.X("published_at:T", title="Published Date"),
-                y=alt.Y("views:Q", title="Views"),
-                tooltip=[
-                    alt.Tooltip("title:N", title="Video"),
-                    alt.Tooltip("views:Q", title="Views", format=","),
-                    alt.Tooltip("published_at:T", title="Date"),
-                ],
-                href="id:N",
-            )
-            .interactive()
-            .properties(height=300)
+        resolution = st.radio(
+            "Resolution",
+            ["Per video", "Daily", "Weekly", "Monthly"],
+            horizontal=True,
+            key="an_resolution",
+            label_visibility="collapsed",
         )
-        st.altair_chart(line_chart, use_container_width=True)
+        with span("chart.views_over_time", cache=True, resolution=resolution):
+            views_chart = views_over_time_chart(snapshot.version, resolution, videos_df)
+        st.altair_chart(views_chart, use_container_width=True)
+
+        # Growth curves and velocity from the local snapshot history (no API calls)
+        with span("chart.history", cache=True):
+            charts = history_charts(snapshot.version, videos_df)
+        if charts is not None:
+            growth_chart, velocity_chart = charts
+            st.markdown("### 📈 View Growth (Top 5)")
+            st.altair_chart(growth_chart, use_container_width=True)
+            st.markdown("### ⚡ View Velocity")
+            st.altair_chart(velocity_chart, use_container_width=True)
+        else:
+            st.caption("Growth and velocity charts appear once a few refreshes have been recorded.")
 
         # Engagement distribution
+        with span("chart.distribution", cache=True, column="likes"):
+            likes_chart = distribution_chart(snapshot.version, "likes", "#ff6b6b", videos_df)
+        with span("chart.distribution", cache=True, column="comments"):
+            comments_chart = distribution_chart(snapshot.version, "comments", "#e0aaff", videos_df)
         c1, c2 = st.columns(2)
         with c1:
             st.markdown("### 👍 Like Distribution")
-            like_data = videos_df[["title", "likes", "id"]].nlargest(15, "likes").copy()
-            like_data["title_short"] = like_data["title"].str[:30]
-            like_chart = (
-                alt.Chart(like_data)
-                .mark_bar(color="#ff6b6b")
-                .encode(
-                    x=alt.X("likes:Q", title="Likes"),
-                    y=alt.Y("title_short:N", title="", sort="-x"),
-                    tooltip=[
-                        alt.Tooltip("title:N", title="Video"),
-                        alt.Tooltip("likes:Q", title="Likes", format=","),
-                    ],
-                )
-                .properties(height=400)
-            )
-            st.altair_chart(like_chart, use_container_width=True)
+            st.altair_chart(likes_chart, use_container_width=True)
         with c2:
             st.markdown("### 💬 Comment Distribution")
-            comment_data = videos_df[["title", "comments", "id"]].nlargest(15, "comments").copy()
-            comment_data["title_short"] = comment_data["title"].str[:30]
-            comment_chart = (
-                alt.Chart(comment_data)
-                .mark_bar(color="#e0aaff")
-                .encode(
-                    x=alt.X("comments:Q", title="Comments"),
-                    y=alt.Y("title_short:N", title="", sort="-x"),
-                    tooltip=[
-                        alt.Tooltip("title:N", title="Video"),
-                        alt.Tooltip("comments:Q", title="Comments", format=","),
-                    ],
-                )
-                .properties(height=400)
-            )
-            st.altair_chart(comment_chart, use_container_width=True)
+            st.altair_chart(comments_chart, use_container_width=True)
 
         # Summary stats
         st.markdown("### 📊 Summary Statistics")
@@ -707,35 +1142,9 @@ elif view == "📈 Analytics":
 
         # Correlation table with embedded videos
         with st.expander("📋 Raw Data Table (with embedded videos)"):
-            for _, row in videos_df.sort_values("published_at", ascending=False).iterrows():
-                video = row.to_dict()
-                video["duration_formatted"] = (
-                    f"{int(video.get('duration_seconds', 0) // 60)}:{int(video.get('duration_seconds', 0) % 60):02d}"
-                    if video.get("duration_seconds")
-                    else "N/A"
-                )
-                video["published_formatted"] = (
-                    row["published_at"].strftime("%b %d, %Y")
-                    if pd.notna(row.get("published_at"))
-                    else "N/A"
-                )
-                col_vid, col_meta = st.columns([1, 2])
-                with col_vid:
-                    embed_video(video["id"], width=240, height=135)
-                with col_meta:
-                    url = f"https://www.youtube.com/watch?v={video['id']}"
-                    st.markdown(f"### [{video['title']}]({url})")
-                    v_views = video.get("views") or 0
-                    v_likes = video.get("likes") or 0
-                    v_comments = video.get("comments") or 0
-                    st.caption(
-                        f"👁 {v_views:,} views | "
-                        f"👍 {v_likes:,} | "
-                        f"💬 {v_comments:,} | "
-                        f"⏱ {video['duration_formatted']} | "
-                        f"📅 {video['published_formatted']}"
-                    )
-                st.divider()
+            raw_page = paginate(videos_df.sort_values("published_at", ascending=False), "raw")
+            with span("render.cards", layout="raw", rows=len(raw_page)):
+                st.markdown(raw_cards_html(raw_page), unsafe_allow_html=True)
     else:
         st.info("No video data available for analytics.")
 
@@ -785,5 +1194,38 @@ elif view == "🔐 Studio (Coming Soon)":
     else:
         st.info("Connect your API key to see public metrics.")
 
+_view_span.stop()
+
 st.divider()
 st.caption("🎬 YouTube Dashboard • Built with Streamlit by The Office • Data from YouTube Data API v3")
+
+# ── Boot timings (first run in this process only) ─────────────────────────
+_boot = boot_timings()
+if not _boot:
+    _boot.update(
+        imports_ms=round(1000 * (_IMPORTS_DONE - _RUN_START)),
+        data_ms=round(1000 * (_data_done - _data_start)),
+        total_ms=round(1000 * (time.perf_counter() - _RUN_START)),
+    )
+    logger.info("boot %s", json.dumps(_boot))
+
+# ── Rerun timings ─────────────────────────────────────────────────────────
+if debug_timings:
+    with st.sidebar.expander("🐞 Rerun timings", expanded=True):
+        st.caption(f"Rerun {run.id}: {run.ms:,.0f} ms so far, {len(run.spans)} spans")
+        spans = sorted(run.spans, key=lambda s: s.start)
+        st.dataframe(
+            pd.DataFrame(
+                {
+                    "span": ["\u2003" * s.depth + s.name for s in spans],
+                    "ms": [s.ms for s in spans],
+                    "cache": [s.attrs.get("cache", "") for s in spans],
+                    "details": [
+                        ", ".join(f"{k}={v}" for k, v in s.attrs.items() if k != "cache") for s in spans
+                    ],
+                }
+            ),
+            hide_index=True,
+            use_container_width=True,
+        )
+finish_run(run, view=view)
@@ -0,0 +1,164 @@
+"""Benchmark rerun latency of every dashboard view — no network used.
+
+Drives app.py headlessly through Streamlit's AppTest against synthetic
+catalogs (the same videos bench/fake_youtube.py serves), with yt_api's
+fetch functions replaced so data comes straight from memory. For each
+catalog size it switches views, clicks every sort and quick-filter chip,
+types searches and changes the Analytics resolution, then reports p50/p95
+rerun time and the number of elements each interaction renders.
+
+    python bench/bench_reruns.py --sizes 50 500 5000 --repeat 5
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+
+from fake_youtube import FakeChannel, FakeYouTube  # noqa: E402
+
+VIEWS = ["📊 Public Overview", "🎥 Video Explorer", "📈 Analytics", "🔐 Studio (Coming Soon)"]
+SEARCHES = ["synthetic", "tutorial", "python ai", "#12", "no such video"]
+RESOLUTIONS = ["Per video", "Daily", "Weekly", "Monthly"]
+
+
+def _configure(workdir: Path) -> None:
+    """Keep the app off the network and out of the real cache. Must run before yt_api is imported."""
+    os.environ["YOUTUBE_API_KEY"] = "fake-key"
+    os.environ["YT_CACHE_DIR"] = str(workdir)
+    os.environ["YT_THUMB_PROXY_URL"] = ""
+    os.environ["YT_LOG_LEVEL"] = "WARNING"
+
+
+def synthetic_catalog(channel: FakeChannel) -> tuple[dict[str, Any], Any]:
+    """(channel info, videos frame) for `channel`, built the way yt_api builds them."""
+    import yt_api
+
+    api = FakeYouTube([channel])
+    items = [api._video(channel.video_id(i)) for i in range(channel.video_count)]
+    info = {
+        "id": channel.id,
+        "title": f"Fake {channel.handle}",
+        "description": "Synthetic channel",
+        "custom_url": channel.handle,
+        "thumbnail": "",
+        "subscriber_count": 1000,
+        "view_count": sum(int(v["statistics"]["viewCount"]) for v in items),
+        "video_count": channel.video_count,
+    }
+    return info, yt_api._build_videos_frame(items)
+
+
+def _patch_api(catalogs: dict[str, tuple[dict[str, Any], Any]]) -> None:
+    """Serve channel info and videos from `catalogs` (keyed by handle) instead of the API."""
+    import yt_api
+
+    yt_api.get_channel_info = lambda channel_id, *a, **k: catalogs[channel_id][0]
+    yt_api.get_channel_videos_df = lambda channel_id, *a, **k: catalogs[channel_id][1]
+    yt_api.has_synced_videos = lambda *a, **k: True
+
+
+def _quiet_streamlit() -> None:
+    """Silence streamlit's loggers, which exist once streamlit.testing is imported."""
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def _element_count(at) -> int:
+    from streamlit.testing.v1.element_tree import Block
+
+    return sum(1 for node in at if not isinstance(node, Block))
+
+
+def _keys(at, prefix: str) -> list[str]:
+    return [b.key for b in at.button if b.key and b.key.startswith(prefix)]
+
+
+class Recorder:
+    """Times AppTest reruns and groups them by interaction."""
+
+    def __init__(self):
+        self.times: dict[str, list[float]] = defaultdict(list)
+        self.elements: dict[str, int] = {}
+
+    def rerun(self, name: str, at, action: Callable[[], Any]) -> None:
+        start = time.perf_counter()
+        action()
+        self.times[name].append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(f"{name}: {at.exception[0].value}")
+        self.elements[name] = _element_count(at)
+
+
+def run_session(channel: FakeChannel, rec: Recorder, timeout: float) -> None:
+    """One browser session's worth of interactions on `channel`."""
+    from streamlit.testing.v1 import AppTest
+
+    _quiet_streamlit()
+    os.environ["YOUTUBE_CHANNEL_ID"] = channel.handle
+    at = AppTest.from_file(str(APP_DIR / "app.py"), default_timeout=timeout)
+    rec.rerun("first run", at, at.run)
+
+    for view in VIEWS:
+        rec.rerun(f"view: {view}", at, lambda: at.sidebar.radio[0].set_value(view).run())
+        rec.rerun(f"rerun: {view}", at, at.run)
+
+    at.sidebar.radio[0].set_value(VIEWS[1]).run()
+    for key in _keys(at, "sort_"):
+        rec.rerun("explorer: sort chip", at, lambda: at.button(key=key).click().run())
+    for key in _keys(at, "filter_"):
+        rec.rerun("explorer: filter chip", at, lambda: at.button(key=key).click().run())
+    for query in SEARCHES:
+        rec.rerun("explorer: search", at, lambda: at.text_input(key="ve_search").set_value(query).run())
+    at.text_input(key="ve_search").set_value("").run()
+    rec.rerun("explorer: next page", at, lambda: at.number_input(key="ve_page").increment().run())
+
+    at.sidebar.radio[0].set_value(VIEWS[2]).run()
+    for resolution in RESOLUTIONS:
+        rec.rerun("analytics: resolution", at, lambda: at.radio(key="an_resolution").set_value(resolution).run())
+
+
+def _percentile(values: list[float], q: int) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--repeat", type=int, default=3, help="Sessions per catalog size")
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds a single rerun may take")
+    args = parser.parse_args()
+
+    _configure(Path(tempfile.mkdtemp(prefix="yt-bench-reruns-")))
+    channels = [FakeChannel(f"@bench{n}", n) for n in args.sizes]
+    _patch_api({channel.handle: synthetic_catalog(channel) for channel in channels})
+
+    header = f"{'videos':>7}  {'interaction':<34}{'runs':>5}{'p50_ms':>9}{'p95_ms':>9}{'elements':>10}"
+    print(header)
+    print("-" * len(header))
+    for channel in channels:
+        rec = Recorder()
+        for _ in range(args.repeat):
+            run_session(channel, rec, args.timeout)
+        for name, times in rec.times.items():
+            print(
+                f"{channel.video_count:>7}  {name:<34}{len(times):>5}"
+                f"{1000 * _percentile(times, 50):>9.1f}{1000 * _percentile(times, 95):>9.1f}"
+                f"{rec.elements[name]:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Measure cold-start costs of yt-dashboard modules — no network used.
+
+Each measurement runs in a fresh interpreter so nothing is already in
+sys.modules: import time of the modules the app loads, and how long
+building the API client takes with discovery's build() versus the
+bundled-document build yt_api uses.
+
+    python bench/bench_startup.py --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+# name → snippet printing a JSON number of seconds
+CASES = {
+    "import streamlit": "import streamlit",
+    "import pandas": "import pandas",
+    "import altair": "import altair",
+    "import yt_refresh": "import yt_refresh",
+    "import yt_api": "import yt_api",
+    "client (build)": (
+        "import yt_api\n"
+        "from googleapiclient.discovery import build\n"
+        "t = time.perf_counter()\n"
+        "build('youtube', 'v3', developerKey='x', static_discovery=True)\n"
+    ),
+    "client (yt_api)": (
+        "import yt_api\n"
+        "t = time.perf_counter()\n"
+        "yt_api._get_client()\n"
+    ),
+}
+
+
+def run_case(snippet: str) -> float:
+    code = (
+        "import time, json\n"
+        "t = time.perf_counter()\n"
+        f"{snippet}\n"
+        "print(json.dumps(time.perf_counter() - t))\n"
+    )
+    env = dict(os.environ, YOUTUBE_API_KEY="fake-key")
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=APP_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    header = f"{'case':<30}{'median_ms':>11}{'min_ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, snippet in CASES.items():
+        times = [run_case(snippet) for _ in range(args.repeat)]
+        print(f"{name:<30}{1000 * statistics.median(times):>11.1f}{1000 * min(times):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
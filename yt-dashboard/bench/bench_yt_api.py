@@ -0,0 +1,106 @@
+"""Benchmark yt_api against the local stand-in server — no real quota used.
+
+Measures wall time, HTTP request count, quota units and peak Python memory
+for get_channel_videos_df, get_videos_details (serial and concurrent) and
+_resolve_channel_id at several catalog sizes. Every measurement starts from
+an empty response cache and handle map.
+
+    python bench/bench_yt_api.py --sizes 100 1000 5000 --latency 0.05
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_youtube import FakeChannel, FakeYouTube, serve  # noqa: E402
+
+
+def _configure(base_url: str, workdir: Path, retries: int) -> None:
+    """Point yt_api at the stand-in. Must run before yt_api is imported."""
+    os.environ["YOUTUBE_API_BASE_URL"] = base_url
+    os.environ["YOUTUBE_API_KEY"] = "fake-key"
+    os.environ["YT_CACHE_DIR"] = str(workdir)
+    os.environ["YT_DAILY_QUOTA"] = str(10**9)
+    os.environ["YT_MAX_RETRIES"] = str(retries)
+
+
+def measure(api: FakeYouTube, workdir: Path, name: str, fn: Callable[[], Any]) -> dict[str, Any]:
+    """Run `fn` once against a cold cache and collect its cost."""
+    import yt_cache
+    import yt_quota
+
+    yt_cache._cache = yt_cache.ResponseCache(workdir / f"{name}-{time.time_ns()}.sqlite3")
+    yt_quota.reset_stats(budget=10**9)
+    api.reset()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    server = api.stats()
+    return {
+        "benchmark": name,
+        "wall_s": round(wall, 3),
+        "requests": server["total_requests"],
+        "units": yt_quota.get_request_stats()["units_used"],
+        "peak_mib": round(peak / 2**20, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated per-request latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=int(os.getenv("YT_MAX_RETRIES", "4")),
+        help="Retries per request (YT_MAX_RETRIES); with --error-rate, measures what retries cost",
+    )
+    args = parser.parse_args()
+
+    channels = [FakeChannel(f"@bench{n}", n) for n in args.sizes]
+    api = FakeYouTube(channels, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate)
+    server = serve(api)
+    workdir = Path(tempfile.mkdtemp(prefix="yt-bench-"))
+    _configure(f"http://127.0.0.1:{server.server_port}/youtube/v3", workdir, args.retries)
+
+    import yt_api
+
+    rows = []
+    for channel in channels:
+        n = channel.video_count
+        video_ids = [channel.video_id(i) for i in range(n)]
+        client = yt_api._get_client()
+        rows += [
+            measure(api, workdir, f"resolve_handle[{n}]", lambda: yt_api._resolve_channel_id(client, channel.handle)),
+            measure(api, workdir, f"channel_videos_df[{n}]", lambda: yt_api.get_channel_videos_df(channel.id, n)),
+            measure(api, workdir, f"videos_details_serial[{n}]", lambda: yt_api.get_videos_details(video_ids, concurrency=1)),
+            measure(api, workdir, f"videos_details_concurrent[{n}]", lambda: yt_api.get_videos_details(video_ids)),
+        ]
+
+    header = f"{'benchmark':<34}{'wall_s':>9}{'requests':>10}{'units':>8}{'peak_mib':>10}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['benchmark']:<34}{row['wall_s']:>9}{row['requests']:>10}"
+            f"{row['units']:>8}{row['peak_mib']:>10}"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Local stand-in for the YouTube Data API v3 endpoints yt_api uses.
+
+Serves deterministic synthetic channels from `channels`, `search`,
+`playlistItems` and `videos`, with ETag/304 support, configurable latency
+and error injection, and a quota meter. Point yt_api at it with
+YOUTUBE_API_BASE_URL=http://127.0.0.1:<port>/youtube/v3.
+
+    python bench/fake_youtube.py --port 8765 --channel @small=100 --channel @big=5000
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+QUOTA_COSTS = {"search": 100}
+EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class FakeChannel:
+    handle: str
+    video_count: int
+
+    @property
+    def id(self) -> str:
+        digest = hashlib.sha256(self.handle.lower().encode()).hexdigest()
+        return "UC" + digest[:22]
+
+    @property
+    def uploads(self) -> str:
+        return "UU" + self.id[2:]
+
+    def video_id(self, index: int) -> str:
+        """ID of the index-th newest upload (11 chars, like real video IDs)."""
+        return f"{self.id[2:8]}{index:05d}"
+
+
+@dataclass
+class FakeYouTube:
+    """Synthetic catalog plus request accounting, shared by all handler threads."""
+
+    channels: list[FakeChannel]
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    quota_limit: Optional[int] = None
+    seed: int = 0
+    requests: dict[str, int] = field(default_factory=dict)
+    units: int = 0
+    not_modified: int = 0
+    errors: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __post_init__(self):
+        self._by_id = {c.id: c for c in self.channels}
+        self._by_handle = {c.handle.lstrip("@").lower(): c for c in self.channels}
+        self._by_uploads = {c.uploads: c for c in self.channels}
+        self._by_video_prefix = {c.id[2:8]: c for c in self.channels}
+
+    # ── Accounting ────────────────────────────────────────────────────────
+    def charge(self, resource: str) -> bool:
+        """Count a request; False if it would exceed the quota limit."""
+        cost = QUOTA_COSTS.get(resource, 1)
+        with self._lock:
+            self.requests[resource] = self.requests.get(resource, 0) + 1
+            if self.quota_limit is not None and self.units + cost > self.quota_limit:
+                return False
+            self.units += cost
+            return True
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "total_requests": sum(self.requests.values()),
+                "units": self.units,
+                "not_modified": self.not_modified,
+                "errors": self.errors,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.units = self.not_modified = self.errors = 0
+
+    # ── Resources ─────────────────────────────────────────────────────────
+    def _channel_for(self, params: dict[str, str]) -> list[FakeChannel]:
+        if "id" in params:
+            return [self._by_id[c] for c in params["id"].split(",") if c in self._by_id]
+        for key in ("forHandle", "forUsername"):
+            if key in params:
+                channel = self._by_handle.get(params[key].lstrip("@").lower())
+                return [channel] if channel else []
+        return []
+
+    def channels_list(self, params: dict[str, str]) -> dict[str, Any]:
+        items = []
+        for c in self._channel_for(params):
+            items.append(
+                {
+                    "id": c.id,
+                    "snippet": {
+                        "title": f"Fake {c.handle}",
+                        "description": f"Synthetic channel with {c.video_count} videos.",
+                        "customUrl": c.handle,
+                        "publishedAt": EPOCH.isoformat().replace("+00:00", "Z"),
+                        "thumbnails": {"high": {"url": f"https://example.invalid/{c.id}.jpg"}},
+                    },
+                    "statistics": {
+                        "subscriberCount": str(c.video_count * 37),
+                        "viewCount": str(c.video_count * 1234),
+                        "videoCount": str(c.video_count),
+                    },
+                    "contentDetails": {"relatedPlaylists": {"uploads": c.uploads}},
+                    "brandingSettings": {"channel": {"keywords": "fake synthetic"}},
+                }
+            )
+        return {"kind": "youtube#channelListResponse", "items": items}
+
+    def search_list(self, params: dict[str, str]) -> dict[str, Any]:
+        channel = self._by_handle.get(params.get("q", "").lstrip("@").lower())
+        items = [{"id": {"kind": "youtube#channel", "channelId": channel.id}}] if channel else []
+        return {"kind": "youtube#searchListResponse", "items": items}
+
+    def playlist_items_list(self, params: dict[str, str]) -> dict[str, Any]:
+        channel = self._by_uploads.get(params.get("playlistId", ""))
+        if channel is None:
+            return {"kind": "youtube#playlistItemListResponse", "items": []}
+        start = int(params.get("pageToken") or 0)
+        size = min(50, int(params.get("maxResults", 5)))
+        end = min(start + size, channel.video_count)
+        body: dict[str, Any] = {
+            "kind": "youtube#playlistItemListResponse",
+            "items": [
+                {"snippet": {"resourceId": {"kind": "youtube#video", "videoId": channel.video_id(i)}}}
+                for i in range(start, end)
+            ],
+        }
+        if end < channel.video_count:
+            body["nextPageToken"] = str(end)
+        return body
+
+    def _video(self, video_id: str) -> Optional[dict[str, Any]]:
+        channel = self._by_video_prefix.get(video_id[:6])
+        if channel is None or not video_id[6:].isdigit():
+            return None
+        index = int(video_id[6:])
+        if index >= channel.video_count:
+            return None
+        rng = random.Random(f"{self.seed}:{video_id}")
+        published = EPOCH + timedelta(hours=6 * (channel.video_count - index))
+        views = int(rng.paretovariate(1.2) * 500)
+        return {
+            "id": video_id,
+            "snippet": {
+                "publishedAt": published.isoformat().replace("+00:00", "Z"),
+                "channelId": channel.id,
+                "channelTitle": f"Fake {channel.handle}",
+                "title": f"Synthetic video #{channel.video_count - index}",
+                "description": "Lorem ipsum dolor sit amet. " * rng.randint(5, 40),
+                "tags": rng.sample(["python", "ai", "streamlit", "youtube", "vlog", "tutorial"], 3),
+                "categoryId": "28",
+                "thumbnails": {
+                    size: {"url": f"https://i.ytimg.com/vi/{video_id}/{size}.jpg"}
+                    for size in ("default", "medium", "high", "standard", "maxres")
+                },
+            },
+            "statistics": {
+                "viewCount": str(views),
+                "likeCount": str(int(views * rng.uniform(0.01, 0.08))),
+                "commentCount": str(int(views * rng.uniform(0.0, 0.01))),
+            },
+            "contentDetails": {"duration": f"PT{rng.randint(0, 59)}M{rng.randint(1, 59)}S"},
+        }
+
+    def videos_list(self, params: dict[str, str]) -> dict[str, Any]:
+        ids = [v for v in params.get("id", "").split(",") if v][:50]
+        items = [video for video in map(self._video, ids) if video is not None]
+        return {"kind": "youtube#videoListResponse", "items": items}
+
+
+def _make_handler(api: FakeYouTube):
+    routes = {
+        "channels": api.channels_list,
+        "search": api.search_list,
+        "playlistItems": api.playlist_items_list,
+        "videos": api.videos_list,
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+            pass
+
+        def _send(self, status: int, body: Optional[dict[str, Any]] = None, etag: str = ""):
+            payload = json.dumps(body).encode() if body is not None else b""
+            self.send_response(status)
+            if payload:
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+            if etag:
+                self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path == "/_stats":
+                return self._send(200, api.stats())
+
+            resource = url.path.rstrip("/").rsplit("/", 1)[-1]
+            if resource not in routes:
+                return self._send(404, {"error": {"code": 404, "message": "Not found"}})
+            if api.latency or api.jitter:
+                time.sleep(api.latency + random.uniform(0, api.jitter))
+
+            if not api.charge(resource):
+                return self._send(
+                    403,
+                    {"error": {"code": 403, "errors": [{"reason": "quotaExceeded"}], "message": "Quota exceeded"}},
+                )
+            if api.error_rate and random.random() < api.error_rate:
+                with api._lock:
+                    api.errors += 1
+                return self._send(
+                    503,
+                    {"error": {"code": 503, "errors": [{"reason": "backendError"}], "message": "Injected"}},
+                )
+
+            params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            body = routes[resource](params)
+            etag = '"' + hashlib.sha256(json.dumps(body, sort_keys=True).encode()).hexdigest()[:27] + '"'
+            body["etag"] = etag.strip('"')
+            if self.headers.get("If-None-Match") == etag:
+                with api._lock:
+                    api.not_modified += 1
+                return self._send(304, etag=etag)
+            self._send(200, body, etag)
+
+    return Handler
+
+
+def serve(api: FakeYouTube, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start the stand-in on a background thread and return the server.
+
+    The base URL to hand to yt_api is
+    f"http://{host}:{server.server_port}/youtube/v3".
+    """
+    server = ThreadingHTTPServer((host, port), _make_handler(api))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-youtube", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--channel",
+        action="append",
+        default=[],
+        metavar="HANDLE=VIDEOS",
+        help="Synthetic channel to serve (repeatable). Default: @thevibecoder69=500",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with a 503")
+    parser.add_argument("--quota-limit", type=int, default=None, help="Units before answering quotaExceeded")
+    args = parser.parse_args()
+
+    specs = args.channel or ["@thevibecoder69=500"]
+    channels = [FakeChannel(h, int(n)) for h, n in (spec.split("=", 1) for spec in specs)]
+    api = FakeYouTube(
+        channels,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        quota_limit=args.quota_limit,
+    )
+    server = ThreadingHTTPServer((args.host, args.port), _make_handler(api))
+    print(f"Fake YouTube API on http://{args.host}:{args.port}/youtube/v3")
+    for c in channels:
+        print(f"  {c.handle:<24} {c.id}  {c.video_count:>6} videos")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,141 @@
 """YouTube Data API v3 client for fetching channel and video metrics."""
 
+import contextvars
+import logging
 import os
 import re
-from datetime import datetime, timezone
-from typing import Any, Optional
-
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterator, Optional
+
+import httplib2
 import isodate
 import pandas as pd
 from dotenv import load_dotenv
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
+# Before the yt_* imports: yt_cache and yt_quota read their settings at import time
 load_dotenv()
 
+import yt_quota  # noqa: E402
+from yt_timing import annotate, propagate, timed  # noqa: E402
+from yt_cache import RESPONSE_MAX_AGE, get_cache, request_key  # noqa: E402
+
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
 YOUTUBE_CHANNEL_ID = os.getenv("YOUTUBE_CHANNEL_ID", "@thevibecoder69")
+# Override to point both clients at a local stand-in (see bench/fake_youtube.py)
+YOUTUBE_API_BASE_URL = os.getenv("YOUTUBE_API_BASE_URL", "")
+# Upper bound on videos.list batches in flight at once
+YT_MAX_CONCURRENCY = int(os.getenv("YT_MAX_CONCURRENCY", "8"))
+
+# (part, fields) pairs per consumer. Each mask asks only for what the
+# parsers and dashboard views read, dropping thumbnail maps, localizations
+# and other payload we'd otherwise download and parse for nothing.
+CHANNEL_PROJECTIONS: dict[str, tuple[str, str]] = {
+    "full": (
+        "snippet,statistics,contentDetails,brandingSettings",
+        "etag,items(id,snippet(title,description,customUrl,publishedAt,country,"
+        "thumbnails/high/url,thumbnails/default/url),statistics,"
+        "contentDetails/relatedPlaylists/uploads,brandingSettings/channel/keywords)",
+    ),
+    # Channel header and metric cards
+    "header": (
+        "snippet,statistics",
+        "etag,items(id,snippet(title,description,customUrl,"
+        "thumbnails/high/url,thumbnails/default/url),statistics)",
+    ),
+    "uploads": ("contentDetails", "etag,items(id,contentDetails/relatedPlaylists/uploads)"),
+}
+VIDEO_PROJECTIONS: dict[str, tuple[str, str]] = {
+    # Video Explorer cards (and the incremental sync store)
+    "full": (
+        "snippet,statistics,contentDetails",
+        "etag,items(id,snippet(title,description,publishedAt,channelId,channelTitle,tags,"
+        "categoryId,thumbnails/high/url,thumbnails/default/url),statistics,contentDetails/duration)",
+    ),
+    # Public Overview list, top-10 and engagement charts
+    "overview": (
+        "snippet,statistics",
+        "etag,items(id,snippet(title,publishedAt,channelId,channelTitle,"
+        "thumbnails/high/url,thumbnails/default/url),statistics)",
+    ),
+    # Analytics charts and summary cards
+    "analytics": (
+        "snippet,statistics,contentDetails",
+        "etag,items(id,snippet(title,publishedAt),statistics,contentDetails/duration)",
+    ),
+    "statistics": ("statistics", "etag,items(id,statistics)"),
+}
+PLAYLIST_ITEMS_FIELDS = "etag,nextPageToken,items/snippet/resourceId/videoId"
+
+logger = logging.getLogger("yt_dashboard.api")
 
 _client = None
+_thread_local = threading.local()
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+# Set while a multi-batch fetch runs, so its snapshots go into one history part
+_history_buffer: contextvars.ContextVar[Optional[list[dict[str, Any]]]] = contextvars.ContextVar(
+    "yt_history_buffer", default=None
+)
+
+
+def _discovery_document() -> str:
+    """The YouTube v3 discovery document bundled with googleapiclient.
+
+    Read from the installed package, so building the client never touches
+    the network; build_from_document parses it once per process.
+    """
+    return get_static_doc("youtube", "v3")
+
+
+def _record_history(items: list[dict[str, Any]]) -> None:
+    """Record a statistics snapshot, or add it to the enclosing _buffered_history() block."""
+    buffer = _history_buffer.get()
+    if buffer is not None:
+        buffer.extend(items)
+    else:
+        _write_history(items)
+
+
+def _write_history(items: list[dict[str, Any]]) -> None:
+    """Append a statistics snapshot (pyarrow is only imported once this is needed).
+
+    History is a by-product of fetching, so a failure here (full disk, bad
+    permissions) is logged and never fails the API call that produced it.
+    """
+    if not items:
+        return
+    try:
+        import yt_history
+
+        yt_history.append_snapshot(items)
+    except Exception:
+        logger.warning("Couldn't record statistics history", exc_info=True)
+
+
+@contextmanager
+def _buffered_history() -> Iterator[None]:
+    """Collect the snapshots recorded inside the block and write them as one part on exit.
+
+    Worker threads started with propagate() share the caller's buffer.
+    """
+    if _history_buffer.get() is not None:
+        yield
+        return
+    buffer: list[dict[str, Any]] = []
+    token = _history_buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _history_buffer.reset(token)
+        _write_history(buffer)
 
 
 def _get_client():
@@ -28,10 +147,121 @@ def _get_client():
                 "YOUTUBE_API_KEY is not set. "
                 "Copy .env.example to .env and add your API key."
             )
-        _client = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
+        client_options = None
+        if YOUTUBE_API_BASE_URL:
+            # googleapiclient appends the youtube/v3 service path itself
+            root = YOUTUBE_API_BASE_URL.rstrip("/").removesuffix("/youtube/v3")
+            client_options = {"api_endpoint": f"{root}/"}
+        _client = build_from_document(
+            _discovery_document(), developerKey=YOUTUBE_API_KEY, client_options=client_options
+        )
     return _client
 
 
+def _thread_http():
+    """Return this thread's pooled HTTP connection.
+
+    httplib2.Http is not thread-safe, so each worker keeps its own and reuses
+    the open connection across the batches it executes.
+    """
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        http = build_http()
+        _thread_local.http = http
+    return http
+
+
+@timed("yt_api.execute")
+def _execute(request, http=None) -> dict[str, Any]:
+    """Execute an API request through the persistent response cache.
+
+    Fresh cached responses are returned without a network call. Stale ones
+    are revalidated with If-None-Match, so unchanged resources come back as
+    a 304 and the stored body is reused. Pass `http` to run the request on a
+    connection other than the client's own (e.g. from a worker thread).
+
+    Every network attempt is charged against the daily budget in yt_quota
+    and recorded in its stats. Transient failures are retried with jittered
+    exponential backoff; when the quota runs out a stale cached body is
+    served if there is one, otherwise QuotaExceededError is raised.
+    """
+    method = request.methodId.removeprefix("youtube.")
+    annotate(method=method)
+    cache = get_cache()
+    key = request_key(request.method, request.uri)
+    cached = cache.get(key)
+    if cached is not None and cached.age < RESPONSE_MAX_AGE:
+        yt_quota.record(method, cache_hit=True)
+        annotate(cache="hit")
+        return cached.body
+    if cached is not None and cached.etag:
+        request.headers["If-None-Match"] = cached.etag
+
+    # Capture the ETag response header; execute() only hands back the body.
+    headers: dict[str, Any] = {}
+    postproc = request.postproc
+
+    def _capture(resp, content):
+        headers["etag"] = resp.get("etag")
+        return postproc(resp, content)
+
+    request.postproc = _capture
+    attempt = 0
+    while True:
+        try:
+            yt_quota.acquire(method)
+        except yt_quota.QuotaExceededError:
+            if cached is not None:
+                annotate(cache="stale")
+                return cached.body
+            raise
+
+        start = time.perf_counter()
+        try:
+            body = request.execute(http=http)
+        except HttpError as e:
+            status = e.resp.status
+            if cached is not None and status == 304:
+                yt_quota.record(method, time.perf_counter() - start, yt_quota.quota_cost(method))
+                cache.touch(key)
+                annotate(cache="revalidated", attempts=attempt + 1)
+                if method == "videos.list":
+                    # Unchanged since last fetch, but still a valid observation for now
+                    _record_history(cached.body.get("items", []))
+                return cached.body
+            reason = yt_quota.error_reason(e.content)
+            retry = yt_quota.is_retryable(status, reason) and attempt < yt_quota.MAX_RETRIES
+            yt_quota.record(
+                method, time.perf_counter() - start, yt_quota.quota_cost(method), error=True, retry=retry
+            )
+            if yt_quota.is_quota_error(status, reason):
+                yt_quota.quota_exhausted()
+                if cached is not None:
+                    annotate(cache="stale")
+                    return cached.body
+                raise yt_quota.QuotaExceededError(
+                    f"YouTube API quota exceeded ({reason}) while calling {method}."
+                ) from e
+            if not retry:
+                raise
+        except (OSError, httplib2.HttpLib2Error):
+            # Connection resets, timeouts and DNS hiccups
+            retry = attempt < yt_quota.MAX_RETRIES
+            yt_quota.record(method, time.perf_counter() - start, error=True, retry=retry)
+            if not retry:
+                raise
+        else:
+            yt_quota.record(method, time.perf_counter() - start, yt_quota.quota_cost(method))
+            cache.put(key, headers.get("etag") or body.get("etag"), body)
+            annotate(cache="miss", attempts=attempt + 1)
+            if method == "videos.list":
+                # Every freshly fetched statistics payload becomes a history snapshot
+                _record_history(body.get("items", []))
+            return body
+        time.sleep(yt_quota.backoff_delay(attempt))
+        attempt += 1
+
+
 def _safe_int(stats: dict, key: str) -> Optional[int]:
     """Safely extract an integer stat. Returns None if the key is missing or 0.
 
@@ -49,36 +279,52 @@ def _safe_int(stats: dict, key: str) -> Optional[int]:
         return None
 
 
+@timed("yt_api.resolve_channel_id")
 def _resolve_channel_id(client, channel_id_or_handle: str) -> str:
-    """Resolve a handle (@name) or channel ID to a canonical channel ID."""
+    """Resolve a handle (@name) or channel ID to a canonical channel ID.
+
+    Lookups go cheapest-first: the persistent handle map, then
+    channels.list(forHandle=...) and forUsername (1 unit each), and only then
+    search.list (100 units). Every successful resolution is stored in the map
+    so later callers skip the API entirely.
+    """
     # If it looks like a channel ID (UC...), return as-is
     if re.match(r"^UC[\w-]{22}$", channel_id_or_handle):
         return channel_id_or_handle
 
-    # Try as a handle (with or without @)
     handle = channel_id_or_handle.lstrip("@")
-    try:
-        resp = (
-            client.search()
-            .list(q=f"@{handle}", type="channel", part="id", maxResults=1)
-            .execute()
-        )
-        items = resp.get("items", [])
+    cache = get_cache()
+    cid = cache.get_channel_id(handle)
+    if cid:
+        return cid
+
+    lookups = [
+        # Handle (@name), the modern identifier
+        lambda: client.channels().list(part="id", forHandle=f"@{handle}", maxResults=1),
+        # Legacy custom URL
+        lambda: client.channels().list(part="id", forUsername=handle, maxResults=1),
+    ]
+    for lookup in lookups:
+        try:
+            items = _execute(lookup()).get("items", [])
+        except HttpError:
+            continue
         if items:
-            return items[0]["id"]["channelId"]
-    except HttpError:
-        pass
+            cid = items[0]["id"]
+            cache.put_channel_id(handle, cid)
+            return cid
 
-    # Try forUsername (legacy custom URL)
+    # Last resort: full-text search
     try:
-        resp = (
-            client.channels()
-            .list(part="id", forUsername=handle, maxResults=1)
-            .execute()
+        resp = _execute(
+            client.search()
+            .list(q=f"@{handle}", type="channel", part="id", maxResults=1)
         )
         items = resp.get("items", [])
         if items:
-            return items[0]["id"]
+            cid = items[0]["id"]["channelId"]
+            cache.put_channel_id(handle, cid)
+            return cid
     except HttpError:
         pass
 
@@ -88,35 +334,40 @@ def _resolve_channel_id(client, channel_id_or_handle: str) -> str:
     )
 
 
-def get_channel_info(channel_id: Optional[str] = None) -> dict[str, Any]:
-    """Fetch channel metadata and statistics."""
+@timed("yt_api.get_channel_info")
+def get_channel_info(
+    channel_id: Optional[str] = None, projection: str = "full"
+) -> dict[str, Any]:
+    """Fetch channel metadata and statistics.
+
+    `projection` names an entry in CHANNEL_PROJECTIONS; fields outside it
+    come back empty in the returned dict.
+    """
     client = _get_client()
     cid = _resolve_channel_id(client, channel_id or YOUTUBE_CHANNEL_ID)
 
-    resp = (
-        client.channels()
-        .list(
-            part="snippet,statistics,contentDetails,brandingSettings",
-            id=cid,
-        )
-        .execute()
-    )
+    part, fields = CHANNEL_PROJECTIONS[projection]
+    resp = _execute(client.channels().list(part=part, id=cid, fields=fields))
 
     items = resp.get("items", [])
     if not items:
         raise ValueError(f"Channel not found: {cid}")
 
-    ch = items[0]
+    return _parse_channel(items[0])
+
+
+def _parse_channel(ch: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a channels.list item into the dashboard's channel dict."""
     snippet = ch.get("snippet", {})
     stats = ch.get("statistics", {})
     branding = ch.get("brandingSettings", {}).get("channel", {})
 
     return {
-        "id": cid,
+        "id": ch["id"],
         "title": snippet.get("title", ""),
         "description": snippet.get("description", ""),
         "custom_url": snippet.get("customUrl", ""),
-        "published_at": snippet.get("published_at", ""),
+        "published_at": snippet.get("publishedAt", ""),
         "thumbnail": snippet.get("thumbnails", {})
         .get("high", snippet.get("thumbnails", {}).get("default", {}))
         .get("url", ""),
@@ -128,127 +379,520 @@ def get_channel_info(channel_id: Optional[str] = None) -> dict[str, Any]:
     }
 
 
-def get_playlist_videos(
-    playlist_id: str, max_results: int = 50
+def _fetch_channels(cids: list[str], projection: str = "full") -> list[dict[str, Any]]:
+    """Fetch raw channels.list items for many channel IDs, 50 per request."""
+    client = _get_client()
+    part, fields = CHANNEL_PROJECTIONS[projection]
+    items = []
+    for i in range(0, len(cids), 50):
+        resp = _execute(
+            client.channels()
+            .list(
+                part=part,
+                id=",".join(cids[i : i + 50]),
+                maxResults=50,
+                fields=fields,
+            )
+        )
+        items.extend(resp.get("items", []))
+    return items
+
+
+@timed("yt_api.get_channels_info")
+def get_channels_info(
+    channel_ids: list[str], projection: str = "full"
 ) -> list[dict[str, Any]]:
-    """Fetch all video IDs from a playlist (handles pagination)."""
+    """Fetch metadata and statistics for many channels at once.
+
+    Handles are resolved through the shared handle map, then up to 50
+    channels are fetched per channels.list call. Results follow the order of
+    `channel_ids`; channels that no longer exist are skipped.
+    """
     client = _get_client()
-    video_ids = []
+    cids = list(dict.fromkeys(_resolve_channel_id(client, c) for c in channel_ids))
+    by_id = {item["id"]: item for item in _fetch_channels(cids, projection)}
+    return [_parse_channel(by_id[cid]) for cid in cids if cid in by_id]
+
+
+def _iter_playlist_pages(
+    playlist_id: str,
+    max_results: int = 50,
+    stop_at: Optional[set[str]] = None,
+) -> Iterator[list[str]]:
+    """Yield the video IDs of a playlist one page at a time.
+
+    If `stop_at` is given, paging stops at the first video ID found in it;
+    that ID and everything after it are left out.
+    """
+    client = _get_client()
+    seen = 0
     next_page = None
 
-    while len(video_ids) < max_results:
-        batch = min(50, max_results - len(video_ids))
-        resp = (
+    while seen < max_results:
+        batch = min(50, max_results - seen)
+        resp = _execute(
             client.playlistItems()
             .list(
                 part="snippet",
                 playlistId=playlist_id,
                 maxResults=batch,
                 pageToken=next_page,
+                fields=PLAYLIST_ITEMS_FIELDS,
             )
-            .execute()
         )
+        page = []
         for item in resp.get("items", []):
             vid = item.get("snippet", {}).get("resourceId", {}).get("videoId")
+            if stop_at and vid in stop_at:
+                if page:
+                    yield page
+                return
             if vid:
-                video_ids.append(vid)
+                page.append(vid)
+        if page:
+            yield page
+        seen += len(page)
         next_page = resp.get("nextPageToken")
         if not next_page:
             break
 
-    return video_ids
 
+def get_playlist_videos(
+    playlist_id: str,
+    max_results: int = 50,
+    stop_at: Optional[set[str]] = None,
+) -> list[dict[str, Any]]:
+    """Fetch all video IDs from a playlist (handles pagination).
+
+    If `stop_at` is given, paging stops at the first video ID found in it;
+    that ID and everything after it are left out.
+    """
+    return [vid for page in _iter_playlist_pages(playlist_id, max_results, stop_at) for vid in page]
+
+
+def _parse_stats(stats: dict[str, Any]) -> dict[str, Any]:
+    """Extract counts and engagement ratios from a video's statistics part."""
+    views = _safe_int(stats, "viewCount")
+    likes = _safe_int(stats, "likeCount")
+    comments = _safe_int(stats, "commentCount")
+
+    # Ratios: only compute if we have both numerator and denominator
+    like_view_ratio = (likes / views) if (likes is not None and views is not None) else None
+    comment_view_ratio = (comments / views) if (comments is not None and views is not None) else None
+
+    return {
+        "views": views,
+        "likes": likes,
+        "comments": comments,
+        "like_view_ratio": like_view_ratio,
+        "comment_view_ratio": comment_view_ratio,
+    }
+
+
+def _parse_video(item: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a videos.list item into the dashboard's video dict."""
+    snippet = item.get("snippet", {})
+    details = item.get("contentDetails", {})
+    duration_iso = details.get("duration", "PT0S")
+    stats = _parse_stats(item.get("statistics", {}))
+
+    return {
+        "id": item["id"],
+        "title": snippet.get("title", ""),
+        "description": snippet.get("description", "")[:300],
+        "published_at": snippet.get("publishedAt", ""),
+        "thumbnail": snippet.get("thumbnails", {})
+        .get("high", snippet.get("thumbnails", {}).get("default", {}))
+        .get("url", ""),
+        "channel_id": snippet.get("channelId", ""),
+        "channel_title": snippet.get("channelTitle", ""),
+        "tags": snippet.get("tags", []),
+        "category_id": snippet.get("categoryId", ""),
+        "views": stats["views"],
+        "likes": stats["likes"],
+        "comments": stats["comments"],
+        "duration": duration_iso,
+        "duration_seconds": isodate.parse_duration(duration_iso).total_seconds(),
+        "like_view_ratio": stats["like_view_ratio"],
+        "comment_view_ratio": stats["comment_view_ratio"],
+    }
+
+
+def _batch_pool() -> ThreadPoolExecutor:
+    """The shared pool batches run on.
+
+    Its threads live for the whole process, so each one's HTTP connection
+    (see _thread_http) is reused across calls, not just within one.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=YT_MAX_CONCURRENCY, thread_name_prefix="yt-batch")
+        return _pool
+
+
+@timed("yt_api.fetch_video_batches")
+def _fetch_video_batches(
+    video_ids: list[str],
+    projection: str = "full",
+    concurrency: Optional[int] = None,
+) -> list[dict[str, Any]]:
+    """Fetch raw videos.list items for `video_ids`, 50 IDs per request.
 
+    `projection` names an entry in VIDEO_PROJECTIONS. At most `concurrency`
+    batches are in flight at once, on the shared pool's threads. Items come
+    back in batch order regardless of which request finished first. Each
+    batch's wall time is recorded on this call's timing span.
+    """
+    client = _get_client()
+    part, fields = VIDEO_PROJECTIONS[projection]
+    batches = [video_ids[i : i + 50] for i in range(0, len(video_ids), 50)]
+    workers = max(1, min(concurrency or YT_MAX_CONCURRENCY, YT_MAX_CONCURRENCY, len(batches)))
+    results: list[Optional[list[dict[str, Any]]]] = [None] * len(batches)
+    batch_ms: list[float] = [0.0] * len(batches)
+
+    def fetch(index: int) -> None:
+        start = time.perf_counter()
+        resp = _execute(
+            client.videos().list(part=part, id=",".join(batches[index]), fields=fields),
+            http=_thread_http() if workers > 1 else None,
+        )
+        results[index] = resp.get("items", [])
+        batch_ms[index] = round(1000 * (time.perf_counter() - start), 1)
+
+    with _buffered_history():
+        _run_batches(fetch, len(batches), workers)
+
+    annotate(batches=len(batches), workers=workers, batch_ms=batch_ms)
+    return [item for items in results for item in items]
+
+
+def _run_batches(fetch: Callable[[int], None], count: int, workers: int) -> None:
+    """Call `fetch` for every batch index, on `workers` of the shared pool's threads."""
+    if workers == 1:
+        for i in range(count):
+            fetch(i)
+    else:
+        # `workers` jobs share one queue of batch indices, capping this call's
+        # concurrency even though the pool is shared with other callers
+        pending = iter(range(count))
+        pending_lock = threading.Lock()
+
+        def drain() -> None:
+            while True:
+                with pending_lock:
+                    index = next(pending, None)
+                if index is None:
+                    return
+                fetch(index)
+
+        futures = [_batch_pool().submit(propagate(drain)) for _ in range(workers)]
+        for future in futures:
+            future.result()
+
+
+@timed("yt_api.get_videos_details")
 def get_videos_details(
     video_ids: list[str],
+    concurrency: Optional[int] = None,
+    projection: str = "full",
 ) -> list[dict[str, Any]]:
-    """Fetch details for a list of video IDs (batches of 50)."""
+    """Fetch details for a list of video IDs (batches of 50, fetched concurrently).
+
+    `concurrency` caps the number of batches in flight (default
+    YT_MAX_CONCURRENCY); pass 1 to fetch serially. `projection` names an
+    entry in VIDEO_PROJECTIONS; fields outside it come back empty.
+    """
+    items = _fetch_video_batches(video_ids, projection, concurrency)
+    return [_parse_video(item) for item in items]
+
+
+# How often statistics are re-fetched, by video age: (max age, refresh interval).
+# Fresh uploads move fast; a year-old video's counts barely change day to day.
+STATS_REFRESH_TIERS: list[tuple[timedelta, timedelta]] = [
+    (timedelta(days=2), timedelta(minutes=15)),
+    (timedelta(days=14), timedelta(hours=1)),
+    (timedelta(days=90), timedelta(hours=6)),
+    (timedelta.max, timedelta(days=1)),
+]
+
+
+def _stats_refresh_interval(published_at: str, now: datetime) -> timedelta:
+    """Pick the statistics refresh interval for a video published at `published_at`."""
+    try:
+        age = now - datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+    except ValueError:
+        age = timedelta(0)
+    for max_age, interval in STATS_REFRESH_TIERS:
+        if age <= max_age:
+            return interval
+    return STATS_REFRESH_TIERS[-1][1]
+
+
+def _get_uploads_playlist(client, cid: str) -> Optional[str]:
+    """Return a channel's uploads playlist ID, or None if the channel is missing."""
+    part, fields = CHANNEL_PROJECTIONS["uploads"]
+    resp = _execute(client.channels().list(part=part, id=cid, fields=fields))
+    items = resp.get("items", [])
+    if not items:
+        return None
+    return items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+
+
+@timed("yt_api.sync_channel_videos")
+def sync_channel_videos(
+    channel_id: Optional[str] = None, max_results: int = 50
+) -> list[dict[str, Any]]:
+    """Incrementally sync a channel's recent videos into the local store.
+
+    Only uploads newer than the newest stored video get full details. Stored
+    videos get a statistics-only refresh once their age tier's interval has
+    passed (see STATS_REFRESH_TIERS), and videos that disappeared from the
+    API are dropped. Returns the `max_results` most recent stored videos.
+    """
     client = _get_client()
-    all_videos = []
+    cid = _resolve_channel_id(client, channel_id or YOUTUBE_CHANNEL_ID)
+    uploads_playlist = _get_uploads_playlist(client, cid)
+    if uploads_playlist is None:
+        return []
 
-    for i in range(0, len(video_ids), 50):
-        batch = video_ids[i : i + 50]
-        resp = (
-            client.videos()
-            .list(
-                part="snippet,statistics,contentDetails",
-                id=",".join(batch),
-            )
-            .execute()
+    cache = get_cache()
+    stored = cache.load_videos(cid)
+    known = {video["id"] for video, _ in stored}
+
+    # Stop at the first known upload, unless the store is still short of
+    # max_results and needs back-filling from older pages.
+    stop_at = known if len(known) >= max_results else None
+    video_ids = get_playlist_videos(uploads_playlist, max_results, stop_at=stop_at)
+    new_ids = [vid for vid in video_ids if vid not in known]
+
+    now = datetime.now(timezone.utc)
+    refreshed_at = now.timestamp()
+    if new_ids:
+        cache.save_videos(cid, get_videos_details(new_ids), refreshed_at)
+
+    due = [
+        video
+        for video, last_refresh in stored[:max_results]
+        if refreshed_at - last_refresh
+        >= _stats_refresh_interval(video.get("published_at", ""), now).total_seconds()
+    ]
+    if due:
+        items = _fetch_video_batches([v["id"] for v in due], "statistics")
+        fresh = {item["id"]: _parse_stats(item.get("statistics", {})) for item in items}
+        cache.save_videos(
+            cid, [{**v, **fresh[v["id"]]} for v in due if v["id"] in fresh], refreshed_at
         )
-        for item in resp.get("items", []):
-            snippet = item.get("snippet", {})
-            stats = item.get("statistics", {})
-            details = item.get("contentDetails", {})
-            duration_iso = details.get("duration", "PT0S")
-
-            views = _safe_int(stats, "viewCount")
-            likes = _safe_int(stats, "likeCount")
-            comments = _safe_int(stats, "commentCount")
-
-            # Ratios: only compute if we have both numerator and denominator
-            like_view_ratio = (likes / views) if (likes is not None and views is not None) else None
-            comment_view_ratio = (comments / views) if (comments is not None and views is not None) else None
-
-            all_videos.append(
-                {
-                    "id": item["id"],
-                    "title": snippet.get("title", ""),
-                    "description": snippet.get("description", "")[:300],
-                    "published_at": snippet.get("publishedAt", ""),
-                    "thumbnail": snippet.get("thumbnails", {})
-                    .get("high", snippet.get("thumbnails", {}).get("default", {}))
-                    .get("url", ""),
-                    "channel_title": snippet.get("channelTitle", ""),
-                    "tags": snippet.get("tags", []),
-                    "category_id": snippet.get("categoryId", ""),
-                    "views": views,
-                    "likes": likes,
-                    "comments": comments,
-                    "duration": duration_iso,
-                    "duration_seconds": isodate.parse_duration(duration_iso).total_seconds(),
-                    "like_view_ratio": like_view_ratio,
-                    "comment_view_ratio": comment_view_ratio,
-                }
-            )
+        gone = [v["id"] for v in due if v["id"] not in fresh]
+        if gone:
+            cache.delete_videos(cid, gone)
 
-    return all_videos
+    return [video for video, _ in cache.load_videos(cid)[:max_results]]
 
 
+@timed("yt_api.get_channel_videos")
 def get_channel_videos(
-    channel_id: Optional[str] = None, max_results: int = 50
+    channel_id: Optional[str] = None,
+    max_results: int = 50,
+    incremental: bool = False,
 ) -> list[dict[str, Any]]:
-    """Fetch recent videos from a channel (uses uploads playlist)."""
+    """Fetch recent videos from a channel (uses uploads playlist).
+
+    With `incremental=True` the result comes from sync_channel_videos, so
+    refresh cost scales with what changed rather than with catalog size.
+    """
+    if incremental:
+        return sync_channel_videos(channel_id, max_results)
+
     client = _get_client()
     cid = _resolve_channel_id(client, channel_id or YOUTUBE_CHANNEL_ID)
-
-    # Get the uploads playlist ID
-    resp = (
-        client.channels()
-        .list(part="contentDetails", id=cid)
-        .execute()
-    )
-    items = resp.get("items", [])
-    if not items:
+    uploads_playlist = _get_uploads_playlist(client, cid)
+    if uploads_playlist is None:
         return []
 
-    uploads_playlist = items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
     video_ids = get_playlist_videos(uploads_playlist, max_results)
     return get_videos_details(video_ids)
 
 
+@timed("yt_api.get_channel_videos_df")
 def get_channel_videos_df(
-    channel_id: Optional[str] = None, max_results: int = 50
+    channel_id: Optional[str] = None,
+    max_results: int = 50,
+    incremental: bool = False,
+    projection: str = "full",
+) -> pd.DataFrame:
+    """Fetch channel videos and return as a DataFrame.
+
+    The full fetch builds typed columns straight from the videos.list pages
+    (see _build_videos_frame) without going through per-video dicts, asking
+    only for the VIDEO_PROJECTIONS entry named by `projection`. The
+    incremental store always holds the "full" projection.
+    """
+    if incremental:
+        return _videos_frame(sync_channel_videos(channel_id, max_results))
+
+    client = _get_client()
+    cid = _resolve_channel_id(client, channel_id or YOUTUBE_CHANNEL_ID)
+    uploads_playlist = _get_uploads_playlist(client, cid)
+    if uploads_playlist is None:
+        return pd.DataFrame()
+
+    video_ids = get_playlist_videos(uploads_playlist, max_results)
+    return _build_videos_frame(_fetch_video_batches(video_ids, projection))
+
+
+def iter_channel_videos(
+    channel_id: Optional[str] = None,
+    max_results: int = 50,
+    projection: str = "full",
+    store: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Yield a channel's recent videos as typed DataFrame batches, page by page.
+
+    Each uploads-playlist page is enriched with one videos.list call and
+    yielded straight away, so callers can render the first videos while
+    later pages are still in flight. With `store=True` every batch is also
+    saved to the incremental sync store, so a later
+    get_channel_videos_df(..., incremental=True) starts warm.
+    """
+    if store and projection != "full":
+        raise ValueError("Only the 'full' projection can be written to the sync store.")
+
+    client = _get_client()
+    cid = _resolve_channel_id(client, channel_id or YOUTUBE_CHANNEL_ID)
+    uploads_playlist = _get_uploads_playlist(client, cid)
+    if uploads_playlist is None:
+        return
+
+    for page in _iter_playlist_pages(uploads_playlist, max_results):
+        items = _fetch_video_batches(page, projection)
+        if store:
+            get_cache().save_videos(
+                cid, [_parse_video(item) for item in items], datetime.now(timezone.utc).timestamp()
+            )
+        yield _build_videos_frame(items)
+
+
+@timed("yt_api.has_synced_videos")
+def has_synced_videos(channel_id: Optional[str] = None) -> bool:
+    """Whether the incremental sync store already holds videos for a channel."""
+    cid = _resolve_channel_id(_get_client(), channel_id or YOUTUBE_CHANNEL_ID)
+    return get_cache().count_videos(cid) > 0
+
+
+@timed("yt_api.get_multi_channel_videos_df")
+def get_multi_channel_videos_df(
+    channel_ids: list[str], max_results: int = 50, projection: str = "full"
 ) -> pd.DataFrame:
-    """Fetch channel videos and return as a DataFrame."""
-    videos = get_channel_videos(channel_id, max_results)
+    """Fetch recent videos for a portfolio of channels as one DataFrame.
+
+    Channel lookups are batched 50 per channels.list call and every
+    channel's video IDs are merged into shared 50-ID videos.list batches, so
+    request count grows with total videos rather than channels × pages.
+    `max_results` applies per channel; `channel_id`/`channel_title` tell
+    the rows apart.
+    """
+    client = _get_client()
+    cids = list(dict.fromkeys(_resolve_channel_id(client, c) for c in channel_ids))
+
+    video_ids: list[str] = []
+    for item in _fetch_channels(cids, "uploads"):
+        uploads_playlist = item.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+        if uploads_playlist:
+            video_ids.extend(get_playlist_videos(uploads_playlist, max_results))
+
+    return _build_videos_frame(_fetch_video_batches(video_ids, projection))
+
+
+VIDEO_COLUMNS = [
+    "id", "title", "description", "published_at", "thumbnail", "channel_id",
+    "channel_title", "tags", "category_id", "views", "likes", "comments",
+    "duration", "duration_seconds", "like_view_ratio", "comment_view_ratio",
+]
+_ISO_DURATION = (
+    r"^P(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$"
+)
+
+
+def _count_column(values: pd.Series) -> pd.Series:
+    """Coerce raw counts to Int64, mapping missing, invalid and 0 to <NA> (like _safe_int)."""
+    counts = pd.to_numeric(values.astype(object), errors="coerce").astype("Int64")
+    return counts.mask(counts <= 0)
+
+
+def _duration_seconds(durations: pd.Series) -> pd.Series:
+    """Parse a column of ISO-8601 durations (PT#H#M#S) into seconds in one pass."""
+    parts = durations.str.extract(_ISO_DURATION).astype("float64").fillna(0)
+    return parts["days"] * 86400 + parts["hours"] * 3600 + parts["minutes"] * 60 + parts["seconds"]
+
+
+def _finish_videos_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply the videos schema to raw columns and sort newest first.
+
+    Counts become nullable Int64, ratios are computed column-wise, free text
+    is Arrow-backed and low-cardinality columns are categorical, which keeps
+    memory and build time flat for large catalogs.
+    """
+    text = pd.StringDtype("pyarrow")
+    df["views"] = _count_column(df["views"])
+    df["likes"] = _count_column(df["likes"])
+    df["comments"] = _count_column(df["comments"])
+    df["like_view_ratio"] = (df["likes"] / df["views"]).to_numpy("float64", na_value=float("nan"))
+    df["comment_view_ratio"] = (df["comments"] / df["views"]).to_numpy("float64", na_value=float("nan"))
+
+    df["duration"] = df["duration"].fillna("PT0S").astype(text)
+    df["duration_seconds"] = _duration_seconds(df["duration"])
+    for col in ("id", "title", "description", "thumbnail"):
+        df[col] = df[col].astype(text)
+    df["description"] = df["description"].str.slice(0, 300)
+    for col in ("channel_id", "channel_title", "category_id"):
+        df[col] = df[col].astype("category")
+
+    df["published_at"] = pd.to_datetime(df["published_at"], utc=True)
+    return df[VIDEO_COLUMNS].sort_values("published_at", ascending=False)
+
+
+@timed("yt_api.build_frame")
+def _build_videos_frame(items: list[dict[str, Any]]) -> pd.DataFrame:
+    """Build the videos DataFrame column by column from raw videos.list items."""
+    if not items:
+        return pd.DataFrame()
+
+    snippets = [item.get("snippet", {}) for item in items]
+    stats = [item.get("statistics", {}) for item in items]
+    thumbs = [s.get("thumbnails", {}) for s in snippets]
+    df = pd.DataFrame(
+        {
+            "id": [item["id"] for item in items],
+            "title": [s.get("title", "") for s in snippets],
+            "description": [s.get("description", "") for s in snippets],
+            "published_at": [s.get("publishedAt", "") for s in snippets],
+            "thumbnail": [t.get("high", t.get("default", {})).get("url", "") for t in thumbs],
+            "channel_id": [s.get("channelId", "") for s in snippets],
+            "channel_title": [s.get("channelTitle", "") for s in snippets],
+            "tags": [s.get("tags", []) for s in snippets],
+            "category_id": [s.get("categoryId", "") for s in snippets],
+            "views": [stat.get("viewCount") for stat in stats],
+            "likes": [stat.get("likeCount") for stat in stats],
+            "comments": [stat.get("commentCount") for stat in stats],
+            "duration": [item.get("contentDetails", {}).get("duration", "PT0S") for item in items],
+        }
+    )
+    return _finish_videos_frame(df)
+
+
+@timed("yt_api.build_frame")
+def _videos_frame(videos: list[dict[str, Any]]) -> pd.DataFrame:
+    """Build the videos DataFrame from already-parsed video dicts (e.g. the sync store)."""
     if not videos:
         return pd.DataFrame()
 
     df = pd.DataFrame(videos)
-    df["published_at"] = pd.to_datetime(df["published_at"], utc=True)
-    df = df.sort_values("published_at", ascending=False)
-    return df
+    for col in VIDEO_COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+    return _finish_videos_frame(df)
 
 
 def format_number(n: int) -> str:
@@ -0,0 +1,271 @@
+"""Asyncio counterpart to yt_api, built on a shared httpx.AsyncClient.
+
+Functions mirror their synchronous namesakes in yt_api and return the same
+dict/DataFrame shapes, so many channels and pages can be fetched concurrently
+from one event loop:
+
+    channels = await asyncio.gather(*(get_channel_info(c) for c in handles))
+"""
+
+import asyncio
+import re
+import time
+from typing import Any, Optional
+from urllib.parse import urlencode
+
+import httpx
+import pandas as pd
+
+# yt_api first: it loads .env before yt_cache and yt_quota read their settings
+from yt_api import (
+    CHANNEL_PROJECTIONS,
+    PLAYLIST_ITEMS_FIELDS,
+    VIDEO_PROJECTIONS,
+    YOUTUBE_API_BASE_URL,
+    YOUTUBE_API_KEY,
+    YOUTUBE_CHANNEL_ID,
+    YT_MAX_CONCURRENCY,
+    _parse_channel,
+    _build_videos_frame,
+    _parse_video,
+    _history_buffer,
+    _record_history,
+    _write_history,
+)
+import yt_quota
+from yt_cache import RESPONSE_MAX_AGE, get_cache, request_key
+
+API_BASE_URL = YOUTUBE_API_BASE_URL or "https://www.googleapis.com/youtube/v3"
+
+_session: Optional[httpx.AsyncClient] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_session() -> httpx.AsyncClient:
+    """Return the shared HTTP session for the running event loop."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session_loop is not loop or _session.is_closed:
+        if not YOUTUBE_API_KEY:
+            raise ValueError(
+                "YOUTUBE_API_KEY is not set. "
+                "Copy .env.example to .env and add your API key."
+            )
+        _session = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            params={"key": YOUTUBE_API_KEY},
+            timeout=30,
+            limits=httpx.Limits(max_connections=YT_MAX_CONCURRENCY * 2),
+        )
+        _session_loop = loop
+    return _session
+
+
+async def aclose() -> None:
+    """Close the shared session (call before the event loop shuts down)."""
+    global _session
+    if _session is not None:
+        await _session.aclose()
+        _session = None
+
+
+async def _execute(resource: str, **params: Any) -> dict[str, Any]:
+    """GET `resource` through the persistent response cache.
+
+    Same freshness, ETag revalidation, quota accounting and retry rules as
+    yt_api._execute.
+    """
+    method = f"{resource}.list"
+    params = {k: v for k, v in params.items() if v is not None}
+    cache = get_cache()
+    key = request_key("GET", f"/youtube/v3/{resource}?{urlencode(params)}")
+    # SQLite and Parquet I/O runs on worker threads so it never blocks the event loop
+    cached = await asyncio.to_thread(cache.get, key)
+    if cached is not None and cached.age < RESPONSE_MAX_AGE:
+        yt_quota.record(method, cache_hit=True)
+        return cached.body
+
+    headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else {}
+    attempt = 0
+    while True:
+        try:
+            await asyncio.to_thread(yt_quota.acquire, method)
+        except yt_quota.QuotaExceededError:
+            if cached is not None:
+                return cached.body
+            raise
+
+        start = time.perf_counter()
+        try:
+            resp = await _get_session().get(f"/{resource}", params=params, headers=headers)
+        except httpx.TransportError:
+            retry = attempt < yt_quota.MAX_RETRIES
+            yt_quota.record(method, time.perf_counter() - start, error=True, retry=retry)
+            if not retry:
+                raise
+        else:
+            latency = time.perf_counter() - start
+            status = resp.status_code
+            if cached is not None and status == 304:
+                yt_quota.record(method, latency, yt_quota.quota_cost(method))
+                await asyncio.to_thread(cache.touch, key)
+                if method == "videos.list":
+                    # Unchanged since last fetch, but still a valid observation for now
+                    await asyncio.to_thread(_record_history, cached.body.get("items", []))
+                return cached.body
+            if status < 300:
+                yt_quota.record(method, latency, yt_quota.quota_cost(method))
+                body = resp.json()
+                await asyncio.to_thread(cache.put, key, resp.headers.get("etag") or body.get("etag"), body)
+                if method == "videos.list":
+                    # Every freshly fetched statistics payload becomes a history snapshot
+                    await asyncio.to_thread(_record_history, body.get("items", []))
+                return body
+
+            reason = yt_quota.error_reason(resp.content)
+            retry = yt_quota.is_retryable(status, reason) and attempt < yt_quota.MAX_RETRIES
+            yt_quota.record(method, latency, yt_quota.quota_cost(method), error=True, retry=retry)
+            if yt_quota.is_quota_error(status, reason):
+                await asyncio.to_thread(yt_quota.quota_exhausted)
+                if cached is not None:
+                    return cached.body
+                raise yt_quota.QuotaExceededError(
+                    f"YouTube API quota exceeded ({reason}) while calling {method}."
+                )
+            if not retry:
+                resp.raise_for_status()
+        await asyncio.sleep(yt_quota.backoff_delay(attempt))
+        attempt += 1
+
+
+async def _resolve_channel_id(channel_id_or_handle: str) -> str:
+    """Resolve a handle (@name) or channel ID to a canonical channel ID.
+
+    Same lookup order as yt_api._resolve_channel_id, sharing its handle map.
+    """
+    if re.match(r"^UC[\w-]{22}$", channel_id_or_handle):
+        return channel_id_or_handle
+
+    handle = channel_id_or_handle.lstrip("@")
+    cache = get_cache()
+    cid = await asyncio.to_thread(cache.get_channel_id, handle)
+    if cid:
+        return cid
+
+    lookups = [
+        ("channels", {"part": "id", "forHandle": f"@{handle}", "maxResults": 1}),
+        ("channels", {"part": "id", "forUsername": handle, "maxResults": 1}),
+        ("search", {"part": "id", "q": f"@{handle}", "type": "channel", "maxResults": 1}),
+    ]
+    for resource, params in lookups:
+        try:
+            items = (await _execute(resource, **params)).get("items", [])
+        except httpx.HTTPStatusError:
+            continue
+        if items:
+            cid = items[0]["id"]["channelId"] if resource == "search" else items[0]["id"]
+            await asyncio.to_thread(cache.put_channel_id, handle, cid)
+            return cid
+
+    raise ValueError(
+        f"Could not resolve channel: {channel_id_or_handle}. "
+        "Try using the channel ID directly (UC...)."
+    )
+
+
+async def get_channel_info(
+    channel_id: Optional[str] = None, projection: str = "full"
+) -> dict[str, Any]:
+    """Fetch channel metadata and statistics."""
+    cid = await _resolve_channel_id(channel_id or YOUTUBE_CHANNEL_ID)
+    part, fields = CHANNEL_PROJECTIONS[projection]
+    resp = await _execute("channels", part=part, id=cid, fields=fields)
+    items = resp.get("items", [])
+    if not items:
+        raise ValueError(f"Channel not found: {cid}")
+    return _parse_channel(items[0])
+
+
+async def get_playlist_videos(playlist_id: str, max_results: int = 50) -> list[str]:
+    """Fetch all video IDs from a playlist (handles pagination)."""
+    video_ids: list[str] = []
+    next_page = None
+
+    while len(video_ids) < max_results:
+        resp = await _execute(
+            "playlistItems",
+            part="snippet",
+            playlistId=playlist_id,
+            maxResults=min(50, max_results - len(video_ids)),
+            pageToken=next_page,
+            fields=PLAYLIST_ITEMS_FIELDS,
+        )
+        for item in resp.get("items", []):
+            vid = item.get("snippet", {}).get("resourceId", {}).get("videoId")
+            if vid:
+                video_ids.append(vid)
+        next_page = resp.get("nextPageToken")
+        if not next_page:
+            break
+
+    return video_ids
+
+
+async def _fetch_video_items(
+    video_ids: list[str], projection: str = "full", concurrency: Optional[int] = None
+) -> list[dict[str, Any]]:
+    """Fetch raw videos.list items, running 50-ID batches concurrently."""
+    part, fields = VIDEO_PROJECTIONS[projection]
+    semaphore = asyncio.Semaphore(concurrency or YT_MAX_CONCURRENCY)
+
+    async def fetch(batch: list[str]) -> list[dict[str, Any]]:
+        async with semaphore:
+            resp = await _execute("videos", part=part, id=",".join(batch), fields=fields)
+        return resp.get("items", [])
+
+    batches = [video_ids[i : i + 50] for i in range(0, len(video_ids), 50)]
+    # One history part for the whole call rather than one per batch
+    buffer: list[dict[str, Any]] = []
+    token = _history_buffer.set(buffer)
+    try:
+        results = await asyncio.gather(*(fetch(batch) for batch in batches))
+    finally:
+        _history_buffer.reset(token)
+        await asyncio.to_thread(_write_history, buffer)
+    return [item for items in results for item in items]
+
+
+async def get_videos_details(
+    video_ids: list[str], concurrency: Optional[int] = None, projection: str = "full"
+) -> list[dict[str, Any]]:
+    """Fetch details for a list of video IDs, running 50-ID batches concurrently."""
+    items = await _fetch_video_items(video_ids, projection, concurrency)
+    return [_parse_video(item) for item in items]
+
+
+async def _get_channel_video_ids(channel_id: Optional[str], max_results: int) -> list[str]:
+    """Resolve a channel and list the IDs of its most recent uploads."""
+    cid = await _resolve_channel_id(channel_id or YOUTUBE_CHANNEL_ID)
+    part, fields = CHANNEL_PROJECTIONS["uploads"]
+    resp = await _execute("channels", part=part, id=cid, fields=fields)
+    items = resp.get("items", [])
+    if not items:
+        return []
+
+    uploads_playlist = items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+    return await get_playlist_videos(uploads_playlist, max_results)
+
+
+async def get_channel_videos(
+    channel_id: Optional[str] = None, max_results: int = 50
+) -> list[dict[str, Any]]:
+    """Fetch recent videos from a channel (uses uploads playlist)."""
+    return await get_videos_details(await _get_channel_video_ids(channel_id, max_results))
+
+
+async def get_channel_videos_df(
+    channel_id: Optional[str] = None, max_results: int = 50, projection: str = "full"
+) -> pd.DataFrame:
+    """Fetch channel videos and return as a DataFrame."""
+    video_ids = await _get_channel_video_ids(channel_id, max_results)
+    return _build_videos_frame(await _fetch_video_items(video_ids, projection))
@@ -0,0 +1,260 @@
+"""Persistent on-disk cache for YouTube Data API responses, handles and synced videos.
+
+Also holds the leases that let several dashboard processes share one fetch,
+and the level of the daily quota budget they all draw from.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+CACHE_DIR = Path(os.getenv("YT_CACHE_DIR", Path(__file__).parent / ".cache"))
+# Responses younger than this are served without touching the API at all;
+# older ones are revalidated with If-None-Match.
+RESPONSE_MAX_AGE = int(os.getenv("YT_CACHE_MAX_AGE", "300"))
+# Responses not revalidated for this long are dropped by prune()
+RESPONSE_RETENTION = int(os.getenv("YT_CACHE_RETENTION", str(7 * 24 * 3600)))
+# Handles are reassigned rarely, so resolved IDs are kept for a week.
+HANDLE_TTL = int(os.getenv("YT_HANDLE_TTL", str(7 * 24 * 3600)))
+
+
+@dataclass
+class CachedResponse:
+    etag: Optional[str]
+    body: dict[str, Any]
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+# Query parameters that don't change the response body. googleapiclient
+# always adds alt=json, the async client never sends it.
+_IGNORED_PARAMS = {"key", "alt"}
+
+
+def request_key(method: str, uri: str) -> str:
+    """Build a stable cache key for a request.
+
+    The API key and transport-only parameters are dropped and the rest are
+    sorted, so rotating the key, reordering arguments or switching between
+    yt_api and yt_api_async doesn't miss cached responses.
+    """
+    parts = urlsplit(uri)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query) if k not in _IGNORED_PARAMS)
+    canonical = f"{method} {parts.path}?{urlencode(query)}"
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed store of raw API responses and their ETags.
+
+    Each operation opens its own connection, so one instance can be shared
+    across threads and processes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " etag TEXT,"
+                " body TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS handles ("
+                " handle TEXT PRIMARY KEY,"
+                " channel_id TEXT NOT NULL,"
+                " resolved_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS channel_videos ("
+                " channel_id TEXT NOT NULL,"
+                " video_id TEXT NOT NULL,"
+                " published_at TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " stats_refreshed_at REAL NOT NULL,"
+                " PRIMARY KEY (channel_id, video_id))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                " name TEXT PRIMARY KEY,"
+                " owner TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS quota ("
+                " name TEXT PRIMARY KEY,"
+                " tokens REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT etag, body, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(etag=row[0], body=json.loads(row[1]), fetched_at=row[2])
+
+    def put(self, key: str, etag: Optional[str], body: dict[str, Any]) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, body, fetched_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, etag, json.dumps(body), time.time()),
+            )
+
+    def touch(self, key: str) -> None:
+        """Mark a cached response as fresh again (after a 304)."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+    def get_channel_id(self, handle: str, max_age: float = HANDLE_TTL) -> Optional[str]:
+        """Look up a previously resolved handle, ignoring expired entries."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT channel_id FROM handles WHERE handle = ? AND resolved_at >= ?",
+                (handle.lower(), time.time() - max_age),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_channel_id(self, handle: str, channel_id: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO handles (handle, channel_id, resolved_at)"
+                " VALUES (?, ?, ?)",
+                (handle.lower(), channel_id, time.time()),
+            )
+
+    def load_videos(self, channel_id: str) -> list[tuple[dict[str, Any], float]]:
+        """Return a channel's synced videos (newest first) with their stats refresh times."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT data, stats_refreshed_at FROM channel_videos"
+                " WHERE channel_id = ? ORDER BY published_at DESC",
+                (channel_id,),
+            ).fetchall()
+        return [(json.loads(data), refreshed_at) for data, refreshed_at in rows]
+
+    def count_videos(self, channel_id: str) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM channel_videos WHERE channel_id = ?", (channel_id,)
+            ).fetchone()[0]
+
+    def save_videos(
+        self, channel_id: str, videos: list[dict[str, Any]], refreshed_at: float
+    ) -> None:
+        """Insert or replace synced videos, stamping their stats refresh time."""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO channel_videos"
+                " (channel_id, video_id, published_at, data, stats_refreshed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [
+                    (channel_id, v["id"], v.get("published_at", ""), json.dumps(v), refreshed_at)
+                    for v in videos
+                ],
+            )
+
+    def delete_videos(self, channel_id: str, video_ids: list[str]) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "DELETE FROM channel_videos WHERE channel_id = ? AND video_id = ?",
+                [(channel_id, vid) for vid in video_ids],
+            )
+
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """Try to take the named lease for `ttl` seconds; False if someone else holds it.
+
+        Leases expire on their own, so a crashed holder can't block others
+        for longer than `ttl`.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM leases WHERE name = ? AND expires_at < ?", (name, now))
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO leases (name, owner, expires_at) VALUES (?, ?, ?)",
+                (name, owner, now + ttl),
+            )
+            return cur.rowcount == 1
+
+    def release_lease(self, name: str, owner: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner))
+
+    def update_quota(
+        self, name: str, capacity: float, rate: float, units: float = 0, drain: bool = False
+    ) -> tuple[bool, float]:
+        """Refill the named token bucket, then take `units` from it (or empty it).
+
+        The bucket starts full and refills at `rate` units per second up to
+        `capacity`. Returns whether the units were granted and the level
+        left. The whole read-modify-write holds SQLite's write lock, so
+        concurrent processes can't spend the same units twice.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT tokens, updated_at FROM quota WHERE name = ?", (name,)).fetchone()
+            tokens = capacity if row is None else min(capacity, row[0] + max(0.0, now - row[1]) * rate)
+            granted = tokens >= units
+            if drain:
+                tokens = 0.0
+            elif granted:
+                tokens -= units
+            conn.execute(
+                "INSERT OR REPLACE INTO quota (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (name, tokens, now),
+            )
+        return granted, tokens
+
+    def reset_quota(self, name: str) -> None:
+        """Forget the named bucket's level, so it starts full again."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM quota WHERE name = ?", (name,))
+
+    def prune(self, older_than: float = RESPONSE_RETENTION) -> int:
+        """Drop responses not revalidated in the last `older_than` seconds."""
+        with closing(self._connect()) as conn, conn:
+            cur = conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?",
+                (time.time() - older_than,),
+            )
+            return cur.rowcount
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM responses")
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_cache() -> ResponseCache:
+    """Return the process-wide response cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(CACHE_DIR / "responses.sqlite3")
+    return _cache
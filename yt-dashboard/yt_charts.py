@@ -0,0 +1,112 @@
+"""Chart data preparation: binning, top-N and shape-preserving downsampling.
+
+Everything here turns the full videos frame (or snapshot history) into the
+few hundred rows a chart actually needs, so Vega specs stay small no
+matter how large the channel is.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Most points any single series sends to the browser
+MAX_POINTS = 500
+# Rule (pandas offset alias) per binned resolution of the views-over-time chart
+BIN_RULES = {"Daily": "D", "Weekly": "W-MON", "Monthly": "MS"}
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of a Largest-Triangle-Three-Buckets downsample of (x, y).
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with its neighbours, which keeps
+    peaks and troughs visible. x must be sorted.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    keep = np.empty(threshold, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (the last point for the final bucket)
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[end:nxt_end].mean(), y[end:nxt_end].mean()
+        area = np.abs((x[a] - cx) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (cy - y[a]))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def views_over_time(videos: pd.DataFrame, resolution: str = "Per video", max_points: int = MAX_POINTS) -> pd.DataFrame:
+    """Views by publish date, per video or binned, LTTB-downsampled to max_points.
+
+    Per video: columns published_at, views, title, id. Binned: published_at
+    (bin start), views (total), videos (count), avg_views.
+    """
+    df = videos[["id", "published_at", "views", "title"]].dropna(subset=["published_at"])
+    df = df.sort_values("published_at")
+    if resolution in BIN_RULES:
+        binned = (
+            df.set_index("published_at")
+            .resample(BIN_RULES[resolution])
+            .agg(views=("views", "sum"), videos=("id", "count"))
+        )
+        binned = binned[binned["videos"] > 0]
+        binned["avg_views"] = (binned["views"] / binned["videos"]).round()
+        df = binned.reset_index()
+
+    x = df["published_at"].astype("int64").to_numpy()
+    y = df["views"].astype("Float64").fillna(0).to_numpy("float64")
+    return df.iloc[lttb(x, y, max_points)].reset_index(drop=True)
+
+
+def top_n(videos: pd.DataFrame, column: str, n: int, title_len: int = 30) -> pd.DataFrame:
+    """The n largest videos by `column` with a shortened title for axis labels."""
+    top = videos[["id", "title", column]].dropna(subset=[column]).nlargest(n, column).copy()
+    top["title_short"] = top["title"].str[:title_len]
+    return top
+
+
+def thin_scatter(videos: pd.DataFrame, x: str, y: str, max_points: int = MAX_POINTS, keep_top: int = 100) -> pd.DataFrame:
+    """Subsample a scatter: the `keep_top` largest by x plus an even spread of the rest."""
+    df = videos.dropna(subset=[x, y])
+    if len(df) <= max_points:
+        return df
+    df = df.sort_values(x, ascending=False)
+    rest = df.iloc[keep_top:]
+    step = len(rest) / (max_points - keep_top)
+    picks = (np.arange(max_points - keep_top) * step).astype(int)
+    return pd.concat([df.iloc[:keep_top], rest.iloc[picks]])
+
+
+def downsample_history(history: pd.DataFrame, max_points: int = MAX_POINTS // 2) -> pd.DataFrame:
+    """LTTB-downsample each video's snapshot series to at most `max_points`."""
+    if history.empty:
+        return history
+    parts = []
+    for _, series in history.groupby("video_id", sort=False):
+        x = series["timestamp"].astype("int64").to_numpy()
+        y = series["views"].astype("Float64").fillna(0).to_numpy("float64")
+        parts.append(series.iloc[lttb(x, y, max_points)])
+    return pd.concat(parts, ignore_index=True)
+
+
+def view_velocity(history: pd.DataFrame, n: Optional[int] = 10) -> pd.DataFrame:
+    """Views per day between each video's first and last snapshot, fastest first."""
+    span = history.groupby("video_id").agg(
+        first_ts=("timestamp", "first"),
+        last_ts=("timestamp", "last"),
+        first_views=("views", "first"),
+        last_views=("views", "last"),
+    )
+    days = (span["last_ts"] - span["first_ts"]).dt.total_seconds() / 86400
+    span["views_per_day"] = ((span["last_views"] - span["first_views"]) / days).where(days > 0)
+    velocity = span.dropna(subset=["views_per_day"])
+    velocity = velocity.nlargest(n, "views_per_day") if n is not None else velocity
+    return velocity.reset_index()
@@ -0,0 +1,181 @@
+"""Append-only local store of video statistics snapshots.
+
+Each fetch of video statistics is appended as a small Parquet part file.
+compact() folds the parts into one file sorted by (video_id, timestamp), so
+time-range and video-range reads only touch the row groups they need; the
+dashboard's background refresher runs it, off the request path, once
+COMPACT_THRESHOLD parts have piled up. Appends, compaction and reads may
+run on many threads and processes at once: compaction holds a yt_cache
+lease and readers tolerate parts disappearing under them.
+"""
+
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from yt_cache import CACHE_DIR, get_cache
+
+HISTORY_DIR = Path(os.getenv("YT_HISTORY_DIR", CACHE_DIR / "history"))
+# Fold part files into the main file once this many have piled up.
+COMPACT_THRESHOLD = int(os.getenv("YT_HISTORY_COMPACT_THRESHOLD", "64"))
+# Longest a compaction may hold its lease before another process may take over
+COMPACT_LEASE_TTL = 300
+
+SCHEMA = pa.schema(
+    [
+        ("video_id", pa.string()),
+        ("timestamp", pa.timestamp("s", tz="UTC")),
+        ("views", pa.int64()),
+        ("likes", pa.int64()),
+        ("comments", pa.int64()),
+    ]
+)
+
+
+def _count(stats: dict[str, Any], key: str) -> Optional[int]:
+    try:
+        return int(stats[key])
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+def _utc(value: datetime) -> datetime:
+    ts = pd.Timestamp(value)
+    ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+    return ts.to_pydatetime()
+
+
+def _to_pandas(table: pa.Table) -> pd.DataFrame:
+    """Convert to pandas keeping the counts as nullable Int64."""
+    return table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+
+
+def _parts() -> list[Path]:
+    return sorted(HISTORY_DIR.glob("part-*.parquet"))
+
+
+def pending_parts() -> int:
+    """Part files written since the last compaction."""
+    return len(_parts())
+
+
+def append_snapshot(items: Iterable[dict[str, Any]], timestamp: Optional[datetime] = None) -> None:
+    """Append the statistics of raw videos.list items as one snapshot.
+
+    Items without a statistics part are ignored. Writes one part file and
+    never compacts, so it stays cheap on the fetch path.
+    """
+    rows = [(item["id"], item["statistics"]) for item in items if "statistics" in item]
+    if not rows:
+        return
+
+    ts = (timestamp or datetime.now(timezone.utc)).replace(microsecond=0)
+    table = pa.table(
+        {
+            "video_id": [vid for vid, _ in rows],
+            "timestamp": [ts] * len(rows),
+            "views": [_count(s, "viewCount") for _, s in rows],
+            "likes": [_count(s, "likeCount") for _, s in rows],
+            "comments": [_count(s, "commentCount") for _, s in rows],
+        },
+        schema=SCHEMA,
+    )
+    HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+    name = f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+    tmp = HISTORY_DIR / f".{name}.tmp"
+    pq.write_table(table, tmp)
+    os.replace(tmp, HISTORY_DIR / name)
+
+
+def compact() -> int:
+    """Merge the current part files into the main snapshots file.
+
+    Rows are de-duplicated on (video_id, timestamp) and sorted so reads can
+    skip row groups by statistics. Only one compaction runs at a time across
+    all processes; if another is running this returns straight away. Parts
+    appended while merging are left for the next run. Returns the number of
+    part files merged.
+    """
+    cache = get_cache()
+    lease = f"history-compact:{HISTORY_DIR}"
+    owner = f"{os.getpid()}:{threading.get_ident()}"
+    if not cache.acquire_lease(lease, owner, COMPACT_LEASE_TTL):
+        return 0
+    try:
+        parts = _parts()
+        if not parts:
+            return 0
+
+        main = HISTORY_DIR / "snapshots.parquet"
+        sources = ([main] if main.exists() else []) + parts
+        table = pa.concat_tables([pq.read_table(p, schema=SCHEMA) for p in sources])
+        df = (
+            _to_pandas(table)
+            .drop_duplicates(["video_id", "timestamp"])
+            .sort_values(["video_id", "timestamp"])
+        )
+        merged = pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+
+        tmp = HISTORY_DIR / f".snapshots.{os.getpid()}.{threading.get_ident()}.tmp"
+        pq.write_table(merged, tmp, row_group_size=50_000)
+        # The merged file replaces the main one before any part is removed,
+        # so every row is always in at least one file readers can see.
+        os.replace(tmp, main)
+        for p in parts:
+            p.unlink(missing_ok=True)
+        return len(parts)
+    finally:
+        cache.release_lease(lease, owner)
+
+
+def read_snapshots(
+    video_ids: Optional[Iterable[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Read snapshots, optionally limited to some videos and a time range.
+
+    Filters are pushed down into the Parquet scan. Returns columns
+    video_id, timestamp, views, likes, comments sorted by video and time.
+    """
+    parts = _parts()
+    main = HISTORY_DIR / "snapshots.parquet"
+    if not parts and not main.exists():
+        return _to_pandas(SCHEMA.empty_table())
+
+    expr = None
+    conditions = []
+    if video_ids is not None:
+        conditions.append(pc.field("video_id").isin(list(video_ids)))
+    if start is not None:
+        conditions.append(pc.field("timestamp") >= _utc(start))
+    if end is not None:
+        conditions.append(pc.field("timestamp") <= _utc(end))
+    for cond in conditions:
+        expr = cond if expr is None else expr & cond
+
+    # Parts first, main file last: a part that a concurrent compact() removed
+    # was merged into the main file before it went, so skipping it loses nothing.
+    tables = []
+    for path in parts + [main]:
+        try:
+            tables.append(ds.dataset(str(path), schema=SCHEMA, format="parquet").to_table(filter=expr))
+        except FileNotFoundError:
+            continue
+    table = pa.concat_tables(tables) if tables else SCHEMA.empty_table()
+    return (
+        _to_pandas(table)
+        .drop_duplicates(["video_id", "timestamp"])
+        .sort_values(["video_id", "timestamp"])
+        .reset_index(drop=True)
+    )
@@ -0,0 +1,164 @@
+"""Quota accounting, rate limiting and retry policy for YouTube Data API calls."""
+
+import json
+import os
+import random
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from yt_cache import get_cache
+
+# Unit cost per method (https://developers.google.com/youtube/v3/determine_quota_cost).
+# Everything we call that isn't listed here costs 1 unit.
+QUOTA_COSTS = {
+    "search.list": 100,
+}
+DAILY_QUOTA_BUDGET = int(os.getenv("YT_DAILY_QUOTA", "10000"))
+MAX_RETRIES = int(os.getenv("YT_MAX_RETRIES", "4"))
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+RETRYABLE_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "backendError"}
+QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+
+class QuotaExceededError(RuntimeError):
+    """Raised when the daily quota (local budget or YouTube's) is used up."""
+
+
+def quota_cost(method: str) -> int:
+    return QUOTA_COSTS.get(method, 1)
+
+
+def error_reason(content: Any) -> str:
+    """Extract the first `reason` from a YouTube API error body, or ''."""
+    try:
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", "replace")
+        errors = json.loads(content)["error"]["errors"]
+        return errors[0].get("reason", "")
+    except (ValueError, KeyError, IndexError, TypeError):
+        return ""
+
+
+def is_retryable(status: int, reason: str) -> bool:
+    return status in RETRYABLE_STATUSES or reason in RETRYABLE_REASONS
+
+
+def is_quota_error(status: int, reason: str) -> bool:
+    return status == 403 and reason in QUOTA_REASONS
+
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff for retry number `attempt` (0-based)."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+
+class TokenBucket:
+    """Daily unit budget that refills continuously over 24 hours.
+
+    The level is kept in the shared yt_cache database rather than in memory,
+    so restarts don't refill it and every process using the same
+    YT_CACHE_DIR draws from one budget.
+    """
+
+    def __init__(self, capacity: int, period: float = 24 * 3600, name: str = "youtube"):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.name = name
+
+    def _update(self, units: float = 0, drain: bool = False) -> tuple[bool, float]:
+        return get_cache().update_quota(self.name, self.capacity, self.rate, units, drain)
+
+    def try_consume(self, units: int) -> bool:
+        return self._update(units)[0]
+
+    def drain(self) -> None:
+        """Empty the bucket (YouTube reported the real quota as exhausted)."""
+        self._update(drain=True)
+
+    def refill(self) -> None:
+        get_cache().reset_quota(self.name)
+
+    @property
+    def available(self) -> float:
+        return self._update()[1]
+
+
+@dataclass
+class MethodStats:
+    calls: int = 0
+    cache_hits: int = 0
+    units: int = 0
+    errors: int = 0
+    retries: int = 0
+    total_latency: float = 0.0
+
+
+_bucket = TokenBucket(DAILY_QUOTA_BUDGET)
+_stats: dict[str, MethodStats] = {}
+_stats_lock = threading.Lock()
+
+
+def acquire(method: str) -> None:
+    """Take `method`'s unit cost from the daily budget or raise QuotaExceededError."""
+    if not _bucket.try_consume(quota_cost(method)):
+        raise QuotaExceededError(
+            f"Daily YouTube API budget of {_bucket.capacity} units is used up "
+            f"({method} needs {quota_cost(method)}). Raise YT_DAILY_QUOTA or try later."
+        )
+
+
+def quota_exhausted() -> None:
+    """Record that YouTube itself rejected a call for quota reasons."""
+    _bucket.drain()
+
+
+def record(
+    method: str,
+    latency: float = 0.0,
+    units: int = 0,
+    error: bool = False,
+    retry: bool = False,
+    cache_hit: bool = False,
+) -> None:
+    """Add one request attempt (or cache hit) to the per-method stats."""
+    with _stats_lock:
+        stats = _stats.setdefault(method, MethodStats())
+        if cache_hit:
+            stats.cache_hits += 1
+            return
+        stats.calls += 1
+        stats.units += units
+        stats.total_latency += latency
+        stats.errors += int(error)
+        stats.retries += int(retry)
+
+
+def get_request_stats() -> dict[str, Any]:
+    """Snapshot of per-method usage plus remaining budget, for display."""
+    with _stats_lock:
+        methods = {
+            name: {
+                **asdict(s),
+                "avg_latency_ms": round(1000 * s.total_latency / s.calls, 1) if s.calls else None,
+            }
+            for name, s in sorted(_stats.items())
+        }
+    return {
+        "methods": methods,
+        "units_used": sum(m["units"] for m in methods.values()),
+        "budget": _bucket.capacity,
+        "budget_remaining": int(_bucket.available),
+    }
+
+
+def reset_stats(budget: Optional[int] = None) -> None:
+    """Clear usage stats and refill the shared budget (optionally resizing it)."""
+    global _bucket
+    with _stats_lock:
+        _stats.clear()
+    _bucket = TokenBucket(budget if budget is not None else DAILY_QUOTA_BUDGET)
+    _bucket.refill()
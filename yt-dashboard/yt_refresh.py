@@ -0,0 +1,240 @@
+"""Background refresher that serves the last good dashboard snapshot immediately.
+
+Page loads read a published Snapshot and never wait on the API, except for
+the very first load of a channel. A daemon thread re-syncs every tracked
+(channel, max videos) pair on a schedule and swaps in new snapshots
+atomically, both in memory and on disk, so restarts serve the last good
+data straight away (stale-while-revalidate). Snapshot files and fetch
+leases live in the shared cache directory, so several dashboard processes
+pointed at the same YT_CACHE_DIR fetch each key once between them.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from yt_cache import CACHE_DIR, get_cache
+from yt_timing import annotate, cache_miss, span
+
+REFRESH_INTERVAL = int(os.getenv("YT_REFRESH_INTERVAL", "300"))
+# Stop refreshing keys nobody has looked at for this long.
+TRACK_IDLE_TIMEOUT = int(os.getenv("YT_REFRESH_IDLE_TIMEOUT", str(24 * 3600)))
+SNAPSHOT_DIR = CACHE_DIR / "snapshots"
+# A fetch holds its key's lease at most this long; waiters poll for the result.
+LEASE_TTL = int(os.getenv("YT_REFRESH_LEASE_TTL", "120"))
+LEASE_POLL = 0.25
+# How often the worker drops long-unused responses from the API response cache
+PRUNE_INTERVAL = 3600
+
+Key = tuple[str, int]
+Fetch = Callable[[str, int], tuple[dict[str, Any], pd.DataFrame]]
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One consistent (channel, videos) pair as served to page loads."""
+
+    channel: dict[str, Any]
+    videos: pd.DataFrame
+    fetched_at: float
+    # Content hash of the videos frame; unchanged data keeps the same version
+    version: str
+    error: Optional[str] = None
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+def dataset_version(videos: pd.DataFrame) -> str:
+    """Stable content hash of the columns the dashboard renders and searches."""
+    if videos.empty:
+        return "empty"
+    cols = [c for c in ("id", "title", "description", "views", "likes", "comments") if c in videos.columns]
+    frame = videos[cols]
+    if "tags" in videos.columns:
+        # Lists aren't hashable; the search index reads tags, so they count too
+        frame = frame.assign(tags=videos["tags"].map(lambda tags: "\x1f".join(map(str, tags)) if isinstance(tags, (list, tuple)) else ""))
+    hashed = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+    return hashlib.sha1(hashed.tobytes()).hexdigest()[:16]
+
+
+def _snapshot_path(key: Key) -> Path:
+    name = hashlib.sha1(f"{key[0]}|{key[1]}".encode()).hexdigest()[:16]
+    return SNAPSHOT_DIR / f"{name}.pkl"
+
+
+class Refresher:
+    """Keeps snapshots for tracked keys fresh from a daemon thread."""
+
+    def __init__(self, fetch: Fetch, interval: float = REFRESH_INTERVAL):
+        self.fetch = fetch
+        self.interval = interval
+        self._snapshots: dict[Key, Snapshot] = {}
+        self._last_access: dict[Key, float] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_prune = 0.0
+
+    def get(self, channel_id: str, max_videos: int) -> Snapshot:
+        """Return the latest snapshot for a key, fetching only if none exists yet."""
+        key = (channel_id, max_videos)
+        with self._lock:
+            self._last_access[key] = time.time()
+            snapshot = self._snapshots.get(key)
+        self._ensure_running()
+        if snapshot is None:
+            snapshot = self._load(key)
+            annotate(cache="disk")
+        if snapshot is None:
+            cache_miss()
+            snapshot = self.refresh(key, raise_errors=True)
+        elif snapshot.age >= self.interval:
+            # Serve what we have; the worker picks this key up right away.
+            self._wake.set()
+        return snapshot
+
+    def has_snapshot(self, channel_id: str, max_videos: int) -> bool:
+        """Whether get() can answer without waiting on the API."""
+        key = (channel_id, max_videos)
+        with self._lock:
+            if key in self._snapshots:
+                return True
+        return self._load(key) is not None
+
+    def refresh(self, key: Key, raise_errors: bool = False) -> Snapshot:
+        """Fetch and publish a new snapshot, keeping the old one on failure.
+
+        Only one process fetches a key at a time: the others wait for its
+        snapshot file and adopt it, so N replicas cost the quota of one.
+        """
+        lease = f"snapshot:{key[0]}|{key[1]}"
+        owner = f"{os.getpid()}:{threading.get_ident()}"
+        cache = get_cache()
+        deadline = time.time() + LEASE_TTL
+        while not cache.acquire_lease(lease, owner, LEASE_TTL):
+            shared = self._load(key, fresh=True)
+            if shared is not None:
+                return shared
+            if time.time() > deadline:
+                break
+            time.sleep(LEASE_POLL)
+
+        try:
+            # Another process may have published while we waited for the lease.
+            shared = self._load(key, fresh=True)
+            if shared is not None:
+                return shared
+            try:
+                with span("refresh.fetch", channel=key[0], max_videos=key[1]):
+                    channel, videos = self.fetch(*key)
+            except Exception as e:
+                if raise_errors:
+                    raise
+                with self._lock:
+                    previous = self._snapshots[key]
+                    snapshot = Snapshot(
+                        previous.channel, previous.videos, previous.fetched_at, previous.version, error=str(e)
+                    )
+                    self._snapshots[key] = snapshot
+                return snapshot
+
+            snapshot = Snapshot(channel, videos, time.time(), dataset_version(videos))
+            self._publish(key, snapshot)
+            return snapshot
+        finally:
+            cache.release_lease(lease, owner)
+
+    def _publish(self, key: Key, snapshot: Snapshot) -> None:
+        path = _snapshot_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        pd.to_pickle((snapshot.channel, snapshot.videos, snapshot.fetched_at, snapshot.version), tmp)
+        # mtime doubles as the snapshot time, so readers can skip unpickling stale files
+        os.utime(tmp, (snapshot.fetched_at, snapshot.fetched_at))
+        os.replace(tmp, path)
+        with self._lock:
+            self._snapshots[key] = snapshot
+
+    def _load(self, key: Key, fresh: bool = False) -> Optional[Snapshot]:
+        """Adopt a snapshot another process (or an earlier run) published, if newer.
+
+        With `fresh`, only a snapshot younger than the refresh interval counts.
+        """
+        path = _snapshot_path(key)
+        with self._lock:
+            current = self._snapshots.get(key)
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if current is not None and mtime <= current.fetched_at:
+            return None
+        if fresh and time.time() - mtime >= self.interval:
+            return None
+        try:
+            channel, videos, fetched_at, version = pd.read_pickle(path)
+        except (FileNotFoundError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+        with self._lock:
+            current = self._snapshots.get(key)
+            if current is not None and fetched_at <= current.fetched_at:
+                return None
+            snapshot = self._snapshots[key] = Snapshot(channel, videos, fetched_at, version)
+            return snapshot
+
+    def _prune_cache(self) -> None:
+        """Keep the response cache bounded: every page token and ID batch adds a row."""
+        self._last_prune = time.time()
+        try:
+            with span("refresh.prune_cache") as prune_span:
+                prune_span.attrs["deleted"] = get_cache().prune()
+        except Exception:
+            pass  # pruning is housekeeping; retry next interval
+
+    def _compact_history(self) -> None:
+        """Fold history part files together here rather than on the fetch path."""
+        # Only once this process has recorded history; pyarrow stays unloaded until then
+        yt_history = sys.modules.get("yt_history")
+        if yt_history is None:
+            return
+        try:
+            if yt_history.pending_parts() < yt_history.COMPACT_THRESHOLD:
+                return
+            with span("refresh.compact_history") as compact_span:
+                compact_span.attrs["merged"] = yt_history.compact()
+        except Exception:
+            pass  # compaction is housekeeping; retry next pass
+
+    def _ensure_running(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="yt-refresher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            now = time.time()
+            with self._lock:
+                due = [
+                    key
+                    for key, seen in self._last_access.items()
+                    if now - seen < TRACK_IDLE_TIMEOUT
+                    and key in self._snapshots
+                    and now - self._snapshots[key].fetched_at >= self.interval
+                ]
+            for key in due:
+                self.refresh(key)
+            if now - self._last_prune >= PRUNE_INTERVAL:
+                self._prune_cache()
+            self._compact_history()
+            self._wake.wait(timeout=min(self.interval, 30))
+            self._wake.clear()
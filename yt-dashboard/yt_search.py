@@ -0,0 +1,166 @@
+"""In-memory full-text search over video titles, descriptions and tags.
+
+An inverted index maps each term to the videos containing it with a
+field-weighted score. Every query token matches as a prefix (so results
+update while typing) and all tokens must match. update() diffs the new
+videos against what is indexed and only re-tokenizes added or changed ones.
+"""
+
+import bisect
+import hashlib
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+# A hit in the title counts three times as much as one in the description
+FIELD_WEIGHTS = {"title": 3.0, "tags": 2.0, "description": 1.0}
+# Exact term matches rank above prefix-only matches
+PREFIX_PENALTY = 0.5
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.casefold())
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if value is None or (not isinstance(value, (list, tuple)) and pd.isna(value)):
+        return ""
+    return " ".join(map(str, value))
+
+
+class SearchIndex:
+    """Inverted index over one channel's videos, safe to share across threads."""
+
+    def __init__(self):
+        self._postings: dict[str, dict[str, float]] = defaultdict(dict)
+        self._doc_terms: dict[str, set[str]] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._vocabulary: list[str] = []
+        # Postings as (slot array, score array), compiled lazily per term
+        self._compiled: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._slots: dict[str, int] = {}
+        self._ids: list[Optional[str]] = []
+        self._free: list[int] = []
+        self._version = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def update(self, videos: pd.DataFrame, version: Any = None) -> None:
+        """Index `videos` (id, title, description, tags), touching only what changed.
+
+        Passing the dataset version makes repeat calls for the same data free.
+        """
+        if version is not None and version == self._version:
+            return
+        docs = {}
+        for vid, *fields in videos[["id", *FIELD_WEIGHTS]].itertuples(index=False):
+            texts = [_field_text(value) for value in fields]
+            docs[vid] = (hashlib.sha1("\x1f".join(texts).encode()).hexdigest(), texts)
+
+        with self._lock:
+            for vid in self._doc_terms.keys() - docs.keys():
+                self._remove(vid)
+            for vid, (fingerprint, texts) in docs.items():
+                if self._fingerprints.get(vid) == fingerprint:
+                    continue
+                self._remove(vid)
+                self._add(vid, fingerprint, texts)
+            self._vocabulary = sorted(self._postings)
+            # Compile changed terms now so searches never pay for it
+            for term in self._vocabulary:
+                self._postings_array(term)
+            self._version = version
+
+    def search_version(self, videos: pd.DataFrame, version: Any, query: str, limit: Optional[int] = None) -> list[str]:
+        """update() to `videos` at `version`, then search, holding the lock throughout.
+
+        Sessions on either side of a refresh can share one index: each
+        search sees exactly the rows of its own version, and switching back
+        and forth only re-indexes the videos that differ.
+        """
+        with self._lock:
+            self.update(videos, version)
+            return self.search(query, limit)
+
+    def _add(self, vid: str, fingerprint: str, texts: Iterable[str]) -> None:
+        weights: dict[str, float] = defaultdict(float)
+        for weight, text in zip(FIELD_WEIGHTS.values(), texts):
+            for term in tokenize(text):
+                weights[term] += weight
+        for term, tf in weights.items():
+            self._postings[term][vid] = 1 + math.log(tf)
+            self._compiled.pop(term, None)
+        slot = self._free.pop() if self._free else len(self._ids)
+        if slot == len(self._ids):
+            self._ids.append(vid)
+        else:
+            self._ids[slot] = vid
+        self._slots[vid] = slot
+        self._doc_terms[vid] = set(weights)
+        self._fingerprints[vid] = fingerprint
+
+    def _remove(self, vid: str) -> None:
+        for term in self._doc_terms.pop(vid, ()):
+            postings = self._postings[term]
+            postings.pop(vid, None)
+            self._compiled.pop(term, None)
+            if not postings:
+                del self._postings[term]
+        self._fingerprints.pop(vid, None)
+        slot = self._slots.pop(vid, None)
+        if slot is not None:
+            self._ids[slot] = None
+            self._free.append(slot)
+
+    def _postings_array(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        compiled = self._compiled.get(term)
+        if compiled is None:
+            postings = self._postings[term]
+            compiled = self._compiled[term] = (
+                np.fromiter((self._slots[vid] for vid in postings), dtype=np.int64, count=len(postings)),
+                np.fromiter(postings.values(), dtype=np.float64, count=len(postings)),
+            )
+        return compiled
+
+    def _expand(self, token: str) -> list[str]:
+        """Indexed terms starting with `token`."""
+        start = bisect.bisect_left(self._vocabulary, token)
+        end = bisect.bisect_left(self._vocabulary, token + "\U0010ffff", start)
+        return self._vocabulary[start:end]
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[str]:
+        """Video IDs matching every token of `query`, best match first."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        with self._lock:
+            n_docs = len(self._doc_terms)
+            total = np.zeros(len(self._ids))
+            matched = None
+            for token in tokens:
+                token_scores = np.zeros(len(self._ids))
+                for term in self._expand(token):
+                    slots, tf = self._postings_array(term)
+                    factor = math.log(1 + n_docs / len(slots)) * (1.0 if term == token else PREFIX_PENALTY)
+                    token_scores[slots] = np.maximum(token_scores[slots], tf * factor)
+                hit = token_scores > 0
+                matched = hit if matched is None else matched & hit
+                if not matched.any():
+                    return []
+                total += token_scores
+            slots = np.flatnonzero(matched)
+            order = slots[np.argsort(-total[slots], kind="stable")]
+            if limit is not None:
+                order = order[:limit]
+            return [self._ids[slot] for slot in order]
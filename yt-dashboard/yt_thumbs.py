@@ -0,0 +1,230 @@
+"""Local thumbnail proxy: fetch each thumbnail once, serve small cached variants.
+
+Cards show thumbnails at 120–320 px, but the API hands out 480 px JPEGs
+that every browser session downloads again. This module fetches the source
+image once, stores resized WebP variants on disk keyed by video (or
+channel image) and width, and serves them from a small HTTP server with
+long-lived cache headers.
+
+    /thumb/v/<video_id>/<width>        video thumbnail (source derived from the ID)
+    /thumb/u/<width>?src=<image URL>   any image on YouTube's image hosts (channel avatars)
+
+The proxy is off unless YT_THUMB_PROXY_URL says where browsers can reach
+it (normally an HTTPS path on your reverse proxy); without it the
+dashboard hotlinks YouTube's images as before. While it runs, variants
+least recently served are deleted once THUMB_DIR passes
+YT_THUMB_CACHE_MAX_MB.
+"""
+
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, quote, urlsplit
+
+from PIL import Image
+
+from yt_cache import CACHE_DIR
+
+THUMB_DIR = CACHE_DIR / "thumbs"
+# URL browsers use to reach the proxy; the proxy only runs when this is set
+THUMB_PROXY_URL = os.getenv("YT_THUMB_PROXY_URL", "")
+THUMB_PROXY_HOST = os.getenv("YT_THUMB_PROXY_HOST", "127.0.0.1")
+THUMB_PROXY_PORT = int(os.getenv("YT_THUMB_PROXY_PORT", "8599"))
+# Disk budget for stored variants, and how often the proxy enforces it
+THUMB_CACHE_MAX_BYTES = int(float(os.getenv("YT_THUMB_CACHE_MAX_MB", "500")) * 1024 * 1024)
+PRUNE_INTERVAL = 3600
+# Body of /thumb/health, so a process that finds the port taken can tell
+# another dashboard's proxy from an unrelated server
+HEALTH_BODY = b"yt-thumbs"
+
+# Variants are rounded up to one of these widths to bound what's stored
+WIDTHS = (120, 240, 320, 480)
+QUALITY = 80
+MAX_AGE = 30 * 24 * 3600
+# Only these hosts can be proxied through /thumb/u
+ALLOWED_HOSTS = {"i.ytimg.com", "yt3.ggpht.com", "yt3.googleusercontent.com"}
+
+_VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]{6,20}$")
+
+
+def variant_width(width: int) -> int:
+    return next((w for w in WIDTHS if w >= width), WIDTHS[-1])
+
+
+def video_source(video_id: str) -> str:
+    return f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
+
+
+def _allowed(url: str) -> bool:
+    parts = urlsplit(url)
+    return parts.scheme == "https" and parts.hostname in ALLOWED_HOSTS
+
+
+def _variant_path(key: str, width: int) -> Path:
+    return THUMB_DIR / key[:2] / f"{key}-{width}.webp"
+
+
+def get_variant(key: str, source: str, width: int) -> Path:
+    """Path of the `width` variant of `source`, fetching and resizing it on first use."""
+    path = _variant_path(key, width)
+    if path.exists():
+        # Mark it recently used so prune() evicts colder variants first
+        os.utime(path)
+        return path
+
+    with urllib.request.urlopen(source, timeout=10) as resp:
+        original = resp.read()
+    image = Image.open(io.BytesIO(original))
+    image = image.convert("RGB")
+    if image.width > width:
+        image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    image.save(tmp, "WEBP", quality=QUALITY, method=4)
+    os.replace(tmp, path)
+    return path
+
+
+def prune(max_bytes: int = THUMB_CACHE_MAX_BYTES) -> int:
+    """Delete the least recently served variants until THUMB_DIR fits in `max_bytes`.
+
+    Returns the number of files deleted.
+    """
+    files = []
+    for path in THUMB_DIR.glob("*/*.webp"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in files)
+    deleted = 0
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        deleted += 1
+    return deleted
+
+
+def _prune_loop() -> None:
+    while True:
+        try:
+            prune()
+        except OSError:
+            pass  # pruning is housekeeping; retry next interval
+        time.sleep(PRUNE_INTERVAL)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+        pass
+
+    def _resolve(self) -> Optional[tuple[str, str, int]]:
+        """(cache key, source URL, width) for the request path, or None if invalid."""
+        url = urlsplit(self.path)
+        parts = url.path.strip("/").split("/")
+        try:
+            if len(parts) == 4 and parts[:2] == ["thumb", "v"] and _VIDEO_ID.match(parts[2]):
+                return parts[2], video_source(parts[2]), variant_width(int(parts[3]))
+            if len(parts) == 3 and parts[:2] == ["thumb", "u"]:
+                source = parse_qs(url.query).get("src", [""])[0]
+                if _allowed(source):
+                    key = hashlib.sha1(source.encode()).hexdigest()[:20]
+                    return key, source, variant_width(int(parts[2]))
+        except ValueError:
+            pass
+        return None
+
+    def do_GET(self):
+        if urlsplit(self.path).path == "/thumb/health":
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(HEALTH_BODY)))
+            self.end_headers()
+            self.wfile.write(HEALTH_BODY)
+            return
+        resolved = self._resolve()
+        if resolved is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        key, source, width = resolved
+        etag = f'"{key}-{width}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        try:
+            body = get_variant(key, source, width).read_bytes()
+        except Exception:
+            # Let the browser load the original rather than show a broken image
+            self.send_response(302)
+            self.send_header("Location", source)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/webp")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", f"public, max-age={MAX_AGE}, immutable")
+        self.send_header("ETag", etag)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _is_proxy(host: str, port: int) -> bool:
+    """Whether a thumbnail proxy (e.g. another dashboard process's) answers on host:port."""
+    probe_host = "127.0.0.1" if host in ("", "0.0.0.0") else host
+    try:
+        with urllib.request.urlopen(f"http://{probe_host}:{port}/thumb/health", timeout=2) as resp:
+            return resp.read() == HEALTH_BODY
+    except OSError:
+        return False
+
+
+def start_server(host: str = THUMB_PROXY_HOST, port: int = THUMB_PROXY_PORT) -> str:
+    """Start the proxy on a daemon thread and return the base URL browsers should use.
+
+    Returns "" (hotlink the originals) when YT_THUMB_PROXY_URL isn't set,
+    or when the port is taken by something other than another dashboard's
+    proxy.
+    """
+    if not THUMB_PROXY_URL:
+        return ""
+    try:
+        server = ThreadingHTTPServer((host, port), _Handler)
+    except OSError:
+        if not _is_proxy(host, port):
+            return ""
+    else:
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="yt-thumbs", daemon=True).start()
+        # Only the process serving the port prunes, so replicas don't race over files
+        threading.Thread(target=_prune_loop, name="yt-thumbs-prune", daemon=True).start()
+    return THUMB_PROXY_URL.rstrip("/")
+
+
+def video_thumb_url(base_url: str, video_id: str, width: int) -> str:
+    """Proxied URL of a video's thumbnail at (about) `width` px."""
+    return f"{base_url}/thumb/v/{video_id}/{variant_width(width)}"
+
+
+def image_url(base_url: str, source: str, width: int) -> str:
+    """Proxied URL for an arbitrary image, or `source` itself if it can't be proxied."""
+    if not base_url or not _allowed(source):
+        return source
+    return f"{base_url}/thumb/u/{variant_width(width)}?src={quote(source, safe='')}"
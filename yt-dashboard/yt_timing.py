@@ -0,0 +1,146 @@
+"""Lightweight timing spans for the dashboard and its data layer.
+
+Every span is written as one JSON log line on the `yt_dashboard.timing`
+logger. Spans that finish while a script run is being collected (see
+start_run) are also kept for the sidebar debug panel. Outside a run, e.g.
+in the background refresher, they are only logged.
+
+    with span("load_data", channel=channel_id):
+        ...
+
+Cached functions call cache_miss() in their body, so a span opened with
+cache=True records whether the call was served from cache.
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("yt_dashboard.timing")
+
+
+@dataclass
+class Span:
+    name: str
+    attrs: dict[str, Any] = field(default_factory=dict)
+    start: float = field(default_factory=time.perf_counter)
+    ms: Optional[float] = None
+    depth: int = 0
+
+    def stop(self, error: Optional[BaseException] = None) -> "Span":
+        if self.ms is not None:
+            return self
+        self.ms = round(1000 * (time.perf_counter() - self.start), 2)
+        if error is not None:
+            self.attrs["error"] = type(error).__name__
+        _current.reset(self._token)
+        run = _run.get()
+        if run is not None:
+            run.spans.append(self)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                json.dumps(
+                    {"span": self.name, "ms": self.ms, "run": run.id if run else None, **self.attrs},
+                    default=str,
+                    ensure_ascii=False,
+                )
+            )
+        return self
+
+
+@dataclass
+class Run:
+    """Spans recorded during one script run."""
+
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    start: float = field(default_factory=time.perf_counter)
+    spans: list[Span] = field(default_factory=list)
+
+    @property
+    def ms(self) -> float:
+        return round(1000 * (time.perf_counter() - self.start), 2)
+
+
+_run: contextvars.ContextVar[Optional[Run]] = contextvars.ContextVar("yt_timing_run", default=None)
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("yt_timing_span", default=None)
+
+
+def start_run() -> Run:
+    """Begin collecting spans for the current script run."""
+    run = Run()
+    _run.set(run)
+    _current.set(None)
+    return run
+
+
+def finish_run(run: Run, **attrs: Any) -> None:
+    """Log a one-line summary of a finished script run."""
+    if logger.isEnabledFor(logging.INFO):
+        summary = {"rerun": run.id, "ms": run.ms, "spans": len(run.spans), **attrs}
+        logger.info(json.dumps(summary, default=str, ensure_ascii=False))
+
+
+def start(name: str, cache: bool = False, **attrs: Any) -> Span:
+    """Open a span; call .stop() on it when the timed section ends."""
+    parent = _current.get()
+    if cache:
+        attrs["cache"] = "hit"
+    span_ = Span(name, attrs, depth=parent.depth + 1 if parent else 0)
+    span_._token = _current.set(span_)
+    return span_
+
+
+class span:
+    """Context manager form of start()/stop()."""
+
+    def __init__(self, name: str, cache: bool = False, **attrs: Any):
+        self._args = (name, cache, attrs)
+
+    def __enter__(self) -> Span:
+        name, cache, attrs = self._args
+        self._span = start(name, cache, **attrs)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        self._span.stop(exc)
+        return False
+
+
+def timed(name: str) -> Callable:
+    """Decorator that wraps every call of a function in a span."""
+
+    def decorate(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def annotate(**attrs: Any) -> None:
+    """Add attributes to the innermost open span, if any."""
+    current = _current.get()
+    if current is not None:
+        current.attrs.update(attrs)
+
+
+def cache_miss() -> None:
+    """Mark the innermost open span as a cache miss (call from a cached function's body)."""
+    annotate(cache="miss")
+
+
+def propagate(fn: Callable) -> Callable:
+    """Bind `fn` to a copy of the current context, for running it on a worker thread.
+
+    Spans opened by the worker then count towards the caller's run.
+    """
+    ctx = contextvars.copy_context()
+    return functools.partial(ctx.run, fn)